@@ -0,0 +1,96 @@
+'''
+Created on 18th October 2026
+
+Regression check of the optimal objectives of the shipped workbooks
+
+The presolve (Model_Presolve), the sparse index sets (Sparse_Index) and the
+data-driven big M values (Big_M_Bounds) each change the model that is handed
+to the solver, and are only correct if they leave the optimum unchanged.
+check_baselines solves the shipped workbooks with HiGHS and compares every
+objective with the baseline recorded with the formulation before these
+changes, i.e. without presolve, with the plant variables created for every
+(period, plant) pair and with a big M of 1000. With big_m='fixed' every big M
+is reset to that hard-coded 1000 before the solve, so that both the derived
+and the hard-coded values can be checked against the same baseline.
+
+Run from the command line, e.g.
+
+    python Baseline_Check.py
+    python Baseline_Check.py --model Industry_Model_Python --no-presolve
+    python Baseline_Check.py --big-m derived fixed
+
+The exit status is 1 if any objective differs from its baseline by more than
+the relative tolerance.
+
+'''
+import argparse
+import importlib
+import sys
+import time
+
+import pandas as pd
+import pyomo.environ as pyo
+
+from Big_M_Bounds import BIG_M
+
+
+#Optimal objective of every model script on its shipped workbook: (workbook, objective)
+BASELINES = {
+    'Industry_Model_Python': ('Industry_User_Interface.xlsx', 21489.878409432),
+    'Base_Model_Python': ('Base_User_Interface.xlsx', 26651.773175047),
+    'Optimal_Decarbonisation_Model_Python': ('Optimal_Decarbonisation_User_Interface.xlsx', 60822.009110604),
+    }
+
+#Relative difference allowed between an objective and its baseline, the default relative MIP gap of HiGHS
+TOLERANCE = 1e-4
+
+
+#Solve the shipped workbook of model_module and compare its objective with the baseline
+#big_m is 'derived' for the values of Big_M_Bounds or 'fixed' for the hard-coded BIG_M of the original formulation
+def check_baseline(model_module, backend = 'highs', presolve = True, time_limit = None, tolerance = TOLERANCE, big_m = 'derived'):
+    if big_m not in ('derived', 'fixed'):
+        raise ValueError("big_m must be 'derived' or 'fixed', not %r" % big_m)
+    workbook, baseline = BASELINES[model_module]
+    module = importlib.import_module(model_module)
+    model = module.build_model(module.load_inputs(workbook))
+    if big_m == 'fixed':
+        for key in model.p_big_M:
+            model.p_big_M[key] = BIG_M
+    start = time.perf_counter()
+    results = module.solve(model, backend = backend, time_limit = time_limit, presolve = presolve)
+    seconds = time.perf_counter() - start
+
+    condition = results.solver.termination_condition
+    objective = pyo.value(model.obj) if condition == pyo.TerminationCondition.optimal else None
+    difference = None if objective is None else (objective - baseline) / abs(baseline)
+    return {'model': model_module, 'workbook': workbook, 'presolve': presolve, 'big_m': big_m, 'termination_condition': str(condition),
+            'baseline': baseline, 'objective': objective, 'difference': difference,
+            'passed': difference is not None and abs(difference) <= tolerance, 'seconds': seconds}
+
+
+#Check the baselines of the given model scripts, or of all of them, as a table with one row per solve
+#Every model is solved once per big M mode, and with several modes the column same_objective compares their objectives
+def check_baselines(models = None, backend = 'highs', presolve = True, time_limit = None, tolerance = TOLERANCE, big_m = ('derived',)):
+    rows = [check_baseline(model_module, backend, presolve, time_limit, tolerance, mode) for model_module in (models or BASELINES) for mode in big_m]
+    table = pd.DataFrame(rows)
+    if len(big_m) > 1:
+        spread = table.groupby('model')['objective'].transform(lambda x: (x.max() - x.min()) / abs(x.max()) if x.notna().all() else float('inf'))
+        table['same_objective'] = spread <= tolerance
+        table['passed'] &= table['same_objective']
+    return table
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Compare the optimal objectives of the shipped workbooks with their recorded baselines')
+    parser.add_argument('--model', nargs = '+', default = None, choices = sorted(BASELINES))
+    parser.add_argument('--backend', default = 'highs')
+    parser.add_argument('--no-presolve', action = 'store_true', help = 'solve without the presolve of Model_Presolve')
+    parser.add_argument('--time-limit', type = float, default = None)
+    parser.add_argument('--tolerance', type = float, default = TOLERANCE, help = 'relative difference allowed from the baseline')
+    parser.add_argument('--big-m', nargs = '+', default = ['derived'], choices = ['derived', 'fixed'], help = 'derived or hard-coded big M values, or both')
+    args = parser.parse_args()
+
+    table = check_baselines(args.model, args.backend, not args.no_presolve, args.time_limit, args.tolerance, args.big_m)
+    print(table.to_string(index = False))
+    if not table['passed'].all():
+        sys.exit(1)
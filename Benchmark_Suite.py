@@ -0,0 +1,225 @@
+'''
+Created on 18th October 2026
+
+Benchmark suite with synthetic fleets and planning horizons
+
+The only test cases of the model are the example workbooks, with up to 76
+power plants and 6 periods. This module generates synthetic user interface
+data for any number of plants and periods and any fuel mix of COAL, NG, OIL
+and REN plants, with the same tables as the PLANT_DATA,
+ENERGY_PLANNING_DATA, CCS_DATA, TECH_IMPLEMENTATION_TIME and other sheets of
+the Optimal Decarbonisation workbook. The data is written to a workbook in the
+layout read by Workbook_Loader, so loading is benchmarked as well.
+
+Every benchmark case is timed phase by phase:
+
+    load        parse the workbook (Workbook_Loader, without the input cache)
+    build       build_model, i.e. multiperiod_energy_planning
+    write       write the problem to an LP file, as the file-based solvers do
+    solve       solve, including the presolve
+    results     extract_results, i.e. the results tables of every period
+
+and reported as one JSON record per case, together with the size of the
+model and the solver status, so that scaling curves can be tracked over time.
+
+Run from the command line, e.g.
+
+    python Benchmark_Suite.py --plants 10 50 200 --periods 6 12 --backend highs --output benchmarks.jsonl
+
+'''
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+import pyomo.environ as pyo
+from openpyxl import Workbook
+
+from Workbook_Loader import SHEET_BLOCKS, SCALAR_CELLS, PlanningInputs, load_workbook_data
+
+
+#Share of each plant class in the generated fleet
+DEFAULT_MIX = {'COAL': 0.1, 'NG': 0.4, 'OIL': 0.05, 'REN': 0.45}
+
+#Fuels of the renewable plants, assigned in turn
+REN_FUELS = ('SOLAR', 'HYDRO', 'BIOGAS', 'BIOMASS', 'MSW')
+
+#CO2 intensity of the plants by fuel
+PLANT_CI = {'COAL': 1.0, 'NG': 0.5, 'OIL': 0.8, 'SOLAR': 0.15, 'HYDRO': 0.15, 'BIOGAS': 0.25, 'BIOMASS': 0.3, 'MSW': 0.3}
+
+#Period data of the first period and its change per period, taken from the example workbook where it has one
+FUEL_COST = {'NG': (165, -1), 'OIL': (180, 0), 'COAL': (110, -1), 'SOLAR': (51, -2), 'HYDRO': (50, 0), 'BIOGAS': (60, 0), 'BIOMASS': (101, 0), 'MSW': (101, 0)}
+CAPEX_1 = {'NG': 141, 'OIL': 150, 'COAL': 220, 'SOLAR': 191, 'HYDRO': 301, 'BIOGAS': 241, 'BIOMASS': 313, 'MSW': 194,
+           'EP_NETs_1': 236, 'EP_NETs_2': 236, 'EP_NETs_3': 373, 'EC_NETs_1': 468, 'EC_NETs_2': 380, 'EC_NETs_3': 90}
+CAPEX_2 = {'NG': 46, 'OIL': 40, 'COAL': 11, 'SOLAR': 2, 'HYDRO': 6, 'BIOGAS': 55, 'BIOMASS': 16, 'MSW': 30,
+           'EP_NETs_1': 86, 'EP_NETs_2': 71, 'EP_NETs_3': 21, 'EC_NETs_1': 17, 'EC_NETs_2': 14, 'EC_NETs_3': 452}
+SOLID = {'SOLID_1': (0.25, 110), 'SOLID_2': (0.35, 90)}
+GAS = {'GAS_1': (0.2, 70), 'GAS_2': (0.3, 50)}
+CCS = {'RR_1': 0.92, 'X_1': 0.26, 'Cost_CCS_1': 8.8, 'FX_Cost_CCS_1': 111, 'RR_2': 0.9, 'X_2': 0.47, 'Cost_CCS_2': 8.31, 'FX_Cost_CCS_2': 72.2}
+NETS = {'EP_NETs_1': (-0.6, 23), 'EP_NETs_2': (-0.7, 23), 'EP_NETs_3': (-1.2, 31), 'EC_NETs_1': (-0.4, 13), 'EC_NETs_2': (-0.5, 19), 'EC_NETs_3': (-5.4, 176)}
+
+#Technologies that become available from the second period, all others from the first
+LATE_TECHNOLOGIES = ('SOLID_1', 'SOLID_2', 'GAS_1', 'GAS_2', 'CCS_1', 'CCS_2') + tuple(NETS)
+
+#Share of the plants commissioned or decommissioned within the horizon
+CHURN = 0.2
+
+#Demand of the first period as a share of the smallest capacity in operation, its growth per period,
+#and the emission limit of the last period as a share of the emission of the fossil fleet
+DEMAND_SHARE = 0.6
+DEMAND_GROWTH = 0.02
+FINAL_LIMIT = 0.2
+
+
+#Synthetic inputs of a fleet of the given number of plants over the given number of periods
+def synthetic_inputs(plants, periods, mix = DEFAULT_MIX, seed = 0, flag = 'min_budget'):
+    rng = random.Random(seed)
+    total = sum(mix.values())
+    counts = {c: int(round(plants * share / total)) for c, share in mix.items()}
+    counts[max(mix, key = mix.get)] += plants - sum(counts.values())
+
+    plant = {}
+    for c, n in counts.items():
+        for k in range(n):
+            fuel = REN_FUELS[k % len(REN_FUELS)] if c == 'REN' else c
+            UB = round(rng.uniform(0.3, 8), 3)
+            #Some renewable plants are commissioned and some fossil plants decommissioned within the horizon
+            ON = rng.randint(2, periods) if c == 'REN' and periods > 1 and rng.random() < CHURN else 1
+            OFF = rng.randint(periods // 2 + 1, periods) if c != 'REN' and periods > 1 and rng.random() < CHURN else periods + 1
+            plant['%s %d' % (fuel, k + 1)] = {'Category': 'REN' if c == 'REN' else 'FOSSIL FUEL', 'Fuel': fuel,
+                                              'LB': round(0.75 * UB, 3) if c == 'REN' else 0, 'UB': UB, 'CI': PLANT_CI[fuel], 'ON': ON, 'OFF': OFF}
+
+    P = range(1, periods + 1)
+    def series(start, change = 0):
+        return {i: max(0, start + change * (i - 1)) for i in P}
+
+    #The demand grows by DEMAND_GROWTH per period within the capacity of the plants in operation and above the minimum generation
+    #of the renewables, and the emission limit falls from that of the fossil fleet to FINAL_LIMIT of it
+    capacity = {i: sum(p['UB'] for p in plant.values() if p['ON'] <= i < p['OFF']) for i in P}
+    minimum = {i: sum(p['LB'] for p in plant.values() if p['ON'] <= i < p['OFF']) for i in P}
+    base = DEMAND_SHARE * min(capacity.values())
+    demand = {i: round(min(0.8 * capacity[i], max(base * (1 + DEMAND_GROWTH) ** (i - 1), 1.05 * minimum[i])), 3) for i in P}
+    fossil_CI = sum(PLANT_CI[c] * counts.get(c, 0) for c in ('COAL', 'NG', 'OIL')) / max(1, sum(counts.get(c, 0) for c in ('COAL', 'NG', 'OIL')))
+    limit = {i: round(fossil_CI * demand[i] * (1 - (1 - FINAL_LIMIT) * (i - 1) / max(1, periods - 1)), 3) for i in P}
+    budget = {i: round(500 * demand[i], 1) for i in P}
+
+    return PlanningInputs(
+        plant = plant,
+        EP = {'Demand': demand, 'Limit': limit, 'Budget': budget},
+        fuel = {c: series(*FUEL_COST[c]) for c in FUEL_COST},
+        REN_CI = {c: series(PLANT_CI[c]) for c in REN_FUELS},
+        REN_COST = {c: series(*FUEL_COST[c]) for c in REN_FUELS},
+        CPX_1 = {c: series(v) for c, v in CAPEX_1.items()},
+        CPX_2 = {c: series(v) for c, v in CAPEX_2.items()},
+        SLD_CI = {c: series(v[0]) for c, v in SOLID.items()},
+        SLD_COST = {c: series(v[1]) for c, v in SOLID.items()},
+        GAS_CI = {c: series(v[0]) for c, v in GAS.items()},
+        GAS_COST = {c: series(v[1]) for c, v in GAS.items()},
+        CCS_data = {c: series(v) for c, v in CCS.items()},
+        NET_CI = {c: series(v[0]) for c, v in NETS.items()},
+        NET_COST = {c: series(v[1]) for c, v in NETS.items()},
+        TIME = {c: {i: 'NO' if c in LATE_TECHNOLOGIES and i == 1 else 'YES' for i in P} for c in LATE_TECHNOLOGIES + REN_FUELS},
+        flag = flag,
+        numperiods = periods + 1,
+        AFF = 0.2,
+        )
+
+
+#Write the inputs to a workbook in the layout of the user interface, as read by Workbook_Loader
+def write_workbook(inputs, path):
+    wb = Workbook()
+    wb.remove(wb.active)
+    sheets = {}
+    def sheet(name):
+        if name not in sheets:
+            sheets[name] = wb.create_sheet(name)
+        return sheets[name]
+
+    for key, (name, header, nrows) in SHEET_BLOCKS.items():
+        table = getattr(inputs, key)
+        ws = sheet(name)
+        columns = list(table)
+        index = list(table[columns[0]]) if columns else []
+        for j, column in enumerate(columns, start = 2):
+            ws.cell(row = header + 1, column = j, value = column)
+        for r, idx in enumerate(index, start = header + 2):
+            ws.cell(row = r, column = 1, value = idx)
+            for j, column in enumerate(columns, start = 2):
+                ws.cell(row = r, column = j, value = table[column][idx])
+
+    for key, (name, row, col) in SCALAR_CELLS.items():
+        value = getattr(inputs, key)
+        sheet(name).cell(row = row, column = col, value = value - 1 if key == 'numperiods' else value)
+    wb.save(path)
+
+
+def _timed(record, phase, function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    record['%s_seconds' % phase] = time.perf_counter() - start
+    return result
+
+
+#Generate, load, build, write, solve and extract the results of one case, returning its benchmark record
+def benchmark_case(plants, periods, mix = DEFAULT_MIX, seed = 0, model_module = 'Optimal_Decarbonisation_Model_Python', backend = None, time_limit = None, mip_gap = None):
+    import importlib
+    module = importlib.import_module(model_module)
+    record = {'plants': plants, 'periods': periods, 'mix': mix, 'seed': seed, 'model': model_module, 'backend': backend,
+              'time_limit': time_limit, 'mip_gap': mip_gap}
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'benchmark.xlsx')
+        write_workbook(synthetic_inputs(plants, periods, mix, seed), path)
+        inputs = _timed(record, 'load', load_workbook_data, path)
+        model = _timed(record, 'build', module.build_model, inputs)
+        _timed(record, 'write', model.write, os.path.join(folder, 'benchmark.lp'), io_options = {'symbolic_solver_labels': False})
+
+    record['rows'] = sum(1 for _ in model.component_data_objects(pyo.Constraint, active = True))
+    record['columns'] = sum(1 for _ in model.component_data_objects(pyo.Var))
+    record['binaries'] = sum(1 for v in model.component_data_objects(pyo.Var) if v.is_binary())
+
+    results = _timed(record, 'solve', module.solve, model, backend = backend, time_limit = time_limit, mip_gap = mip_gap)
+    record['termination_condition'] = str(results.solver.termination_condition)
+    record['objective'] = pyo.value(model.obj, exception = False)
+    if record['objective'] is not None:
+        _timed(record, 'results', module.extract_results, model)
+    return record
+
+
+#Run every combination of the numbers of plants and periods, appending each record to output as a JSON line as soon as it is done
+#An output ending in .csv is written as a table once all cases are done instead
+def run_benchmarks(plants, periods, mix = DEFAULT_MIX, seeds = (0,), output = None, **options):
+    records = []
+    for n in plants:
+        for t in periods:
+            for seed in seeds:
+                record = benchmark_case(n, t, mix, seed, **options)
+                records.append(record)
+                if output is not None and not output.endswith('.csv'):
+                    with open(output, 'a') as f:
+                        f.write(json.dumps(record) + '\n')
+    if output is not None and output.endswith('.csv'):
+        import pandas as pd
+        table = pd.DataFrame(records)
+        table['mix'] = table['mix'].map(json.dumps)
+        table.to_csv(output, index = False)
+    return records
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Benchmark the energy planning model on synthetic fleets')
+    parser.add_argument('--plants', type = int, nargs = '+', default = [7, 20, 50])
+    parser.add_argument('--periods', type = int, nargs = '+', default = [6])
+    parser.add_argument('--mix', type = json.loads, default = DEFAULT_MIX, help = 'share of each plant class as JSON, e.g. \'{"COAL": 1, "NG": 2, "OIL": 0, "REN": 2}\'')
+    parser.add_argument('--seeds', type = int, nargs = '+', default = [0])
+    parser.add_argument('--model', default = 'Optimal_Decarbonisation_Model_Python')
+    parser.add_argument('--backend', default = None)
+    parser.add_argument('--time-limit', type = float, default = None)
+    parser.add_argument('--mip-gap', type = float, default = None)
+    parser.add_argument('--output', default = 'benchmarks.jsonl')
+    args = parser.parse_args()
+
+    run_benchmarks(args.plants, args.periods, args.mix, args.seeds, args.output, model_module = args.model, backend = args.backend,
+                   time_limit = args.time_limit, mip_gap = args.mip_gap)
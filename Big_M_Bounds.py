@@ -0,0 +1,154 @@
+'''
+Created on 18th October 2026
+
+Data-driven big M values for the NETs and compensatory energy deployments
+
+The big M formulations of the NETs and compensatory renewable energy
+deployments (Cons_40 and Cons_46, and Cons_E for the purchased electricity of
+the Industry model) used to bound every deployment by a hard-coded 1000,
+which gives a weak LP relaxation. The values below are derived per period i
+from the input data instead, and only rely on constraints of the model:
+
+    - the power plants generate at most the energy demand D, and emit at most
+      c_plant * D, where c_plant is the largest CO2 intensity of any power
+      plant (with or without CCS) or alternative fuel
+    - the compensatory energy and electricity supply at most D plus the
+      energy consumed by the EC-NETs, and emit at most c_ren per unit
+    - the total emission new_emission cannot be negative, so the CO2 removed
+      by the NETs is at most the CO2 emitted by the other energy sources
+    - the deployments may not decrease from one period to the next, so the
+      big M of period i is at most the big M of period i+1
+
+Each bound follows from these constraints alone, so every solution that is
+feasible for the original formulation already satisfies it, and imposing it
+removes no feasible solution. Capping the values at BIG_M only keeps them no
+looser than the original bound. Baseline_Check compares the optimal objectives
+of the shipped workbooks with the derived and the hard-coded values.
+lp_bound_pass can optionally tighten them further by maximising every
+deployment over the LP relaxation.
+
+The values are keyed by the NETs and compensatory energy options of the
+technology catalogues (see Technology_Catalogue), e.g. ('EP_NETs_1', i) or
+('SOLAR', i), and by the names of the further variables of the variant.
+
+'''
+import math
+
+import pyomo.environ as pyo
+
+from Technology_Catalogue import technology_catalogue, ccs_columns
+
+
+#Upper bound of the deployments in the original formulation
+BIG_M = 1000
+
+#Relative tolerance added to the bounds found by the LP bound pass
+LP_TOL = 1e-6
+
+
+#Big M of every deployment for period i, keyed by (option or variable name, period)
+#demand lists the EP columns that make up the energy demand, direct maps further variables to the EP column that bounds them
+def big_m_values(model, demand, direct = None):
+    direct = direct or {}
+    catalogue = technology_catalogue(model)
+    EP, EC, REN = catalogue.ep_nets, catalogue.ec_nets, catalogue.renewables
+    M = {}
+    for i in model.periods:
+        D = sum(model.EP[c][i] for c in demand)
+        c_plant = max([0] + [model.plant[s]['CI'] * max([1] + [1 - model.CCS_data[ccs_columns(k)[0]][i] for k in catalogue.ccs]) for s in model.plant]
+                      + [model.SLD_CI[c][i] for c in model.SLD_CI] + [model.GAS_CI[c][i] for c in model.GAS_CI])
+        c_ren = max([0] + [model.REN_CI[c][i] for c in model.REN_CI])
+        emitted = (c_plant + c_ren) * D
+        removal = {v: -model.NET_CI[v][i] for v in EP + EC}
+
+        #The bounds below assume that the NETs remove CO2
+        if min(removal.values(), default = 0) < 0:
+            for v in EP + EC + REN:
+                M[v,i] = BIG_M
+        else:
+            for v in EC:
+                if removal[v] > c_ren:
+                    slack = emitted + sum(max(0, c_ren - removal[w]) * BIG_M for w in EC if w != v)
+                    M[v,i] = min(BIG_M, slack / (removal[v] - c_ren))
+                else:
+                    M[v,i] = BIG_M
+
+            EC_total = sum(M[v,i] for v in EC)
+            if EC and min(removal[v] for v in EC) > c_ren:
+                EC_total = min(EC_total, emitted / (min(removal[v] for v in EC) - c_ren))
+
+            for v in EP:
+                slack = emitted + sum(max(0, c_ren - removal[w]) * M[w,i] for w in EC)
+                M[v,i] = min(BIG_M, slack / (removal[v] + c_ren)) if removal[v] + c_ren > 0 else BIG_M
+
+            for v in REN:
+                M[v,i] = min(BIG_M, D + EC_total)
+
+    #The deployment in period i is at most the deployment in period i+1
+    for v in EP + EC + REN:
+        for i in reversed(model.periods[:-1]):
+            M[v,i] = min(M[v,i], M[v,i+1])
+
+    for v, c in direct.items():
+        for i in model.periods:
+            M[v,i] = min(BIG_M, model.EP[c][i])
+    return M
+
+
+#Mutable parameter holding the big M values, which update_big_m recomputes whenever the data of the model changes
+def big_m_param(model, i, demand, direct = None):
+    direct = direct or {}
+    model.big_m_data = (demand, direct)
+    M = big_m_values(model, demand, direct)
+    return pyo.Param(sorted(set(v for v, _ in M)), i, initialize = M, mutable = True)
+
+
+def update_big_m(model):
+    demand, direct = model.big_m_data
+    for (v, i), value in big_m_values(model, demand, direct).items():
+        model.p_big_M[v,i] = value
+
+
+#Deployment of period i bounded by the big M of key v: a NETs or compensatory energy option, or a further variable of the variant
+def deployment(model, v, i):
+    if v in model.NETS:
+        return model.NET[i,v]
+    if v in model.RENEWABLES:
+        return model.REN[i,v]
+    return getattr(model, v)[i]
+
+
+#Maximise every deployment over the LP relaxation of the model and lower its big M to the optimum, returning the number of values tightened
+def lp_bound_pass(model):
+    from pyomo.contrib.appsi.solvers import Highs
+    opt = Highs()
+    if not opt.available():
+        raise RuntimeError("Solver backend 'highs' is not available on this machine")
+    opt.config.load_solution = False
+
+    binaries = [v for v in model.component_data_objects(pyo.Var) if v.is_binary()]
+    objectives = [obj for obj in model.component_data_objects(pyo.Objective, active = True)]
+    for v in binaries:
+        v.domain = pyo.UnitInterval
+    for obj in objectives:
+        obj.deactivate()
+
+    tightened = 0
+    try:
+        for (v, i) in model.p_big_M:
+            model.bound_objective = pyo.Objective(expr = deployment(model, v, i), sense = pyo.maximize)
+            results = opt.solve(model)
+            bound = results.best_objective_bound
+            model.del_component(model.bound_objective)
+            if bound is None or not math.isfinite(bound):
+                continue
+            bound = max(0, bound) * (1 + LP_TOL) + LP_TOL
+            if bound < pyo.value(model.p_big_M[v,i]):
+                model.p_big_M[v,i] = bound
+                tightened += 1
+    finally:
+        for v in binaries:
+            v.domain = pyo.Binary
+        for obj in objectives:
+            obj.activate()
+    return tightened
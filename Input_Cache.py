@@ -0,0 +1,200 @@
+'''
+Created on 18th October 2026
+
+Content-hashed cache of parsed user interface workbooks
+
+Parsing an xlsx workbook through openpyxl dominates start-up time when the
+same inputs are re-run many times. This module keys the parsed tables on the
+SHA-256 of the workbook contents and stores every table in a compressed npz
+file, so an unchanged workbook is loaded without opening it in openpyxl at
+all.
+
+A table is stored column by column as typed arrays of its keys and values, and
+PlanningInputs is rebuilt from them. The entries hold no pickled objects, so
+loading an entry of a shared cache directory never runs code, and they do not
+depend on the pickle protocol or the pandas version.
+
+The cache is bounded by both the age of each entry and the total size of the
+cache directory. Entries are touched on every hit, so the oldest entries by
+last use are evicted first.
+
+'''
+import hashlib
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from Workbook_Loader import SHEET_BLOCKS, SCALAR_CELLS, PlanningInputs, load_workbook_data
+
+
+#Default location of the cache, which may be overridden with the DECO2_CACHE_DIR environment variable
+CACHE_DIR = os.environ.get('DECO2_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.deco2_cache'))
+
+#Entries unused for longer than this many seconds are evicted
+MAX_AGE = 30 * 24 * 3600
+
+#The oldest entries are evicted until the cache occupies at most this many bytes
+MAX_BYTES = 256 * 1024 * 1024
+
+#Bump whenever the layout of PlanningInputs or of the entries changes so that stale entries are never loaded
+CACHE_VERSION = 2
+
+#Kinds of the values in an entry
+_INT, _FLOAT, _STR, _BOOL, _NONE = range(5)
+
+
+#SHA-256 of the workbook contents together with the loader layout
+def workbook_key(file_name):
+    sha = hashlib.sha256()
+    sha.update(repr((CACHE_VERSION, SHEET_BLOCKS, SCALAR_CELLS)).encode())
+    with open(file_name, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+#Remove entries, the files ending in suffix, older than max_age, then the least recently used entries until the cache fits in max_bytes
+def evict(cache_dir = None, max_bytes = MAX_BYTES, max_age = MAX_AGE, suffix = '.npz'):
+    cache_dir = cache_dir or os.path.join(CACHE_DIR, 'inputs')
+    if not os.path.isdir(cache_dir):
+        return
+
+    now = time.time()
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(suffix):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        if max_age is not None and now - stat.st_mtime > max_age:
+            _remove(path)
+        else:
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    if max_bytes is None:
+        return
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+#Add the arrays of a list of keys or values to arrays under name: the kind of every value, and its value in the array of its kind
+def _encode(arrays, name, values):
+    kinds, ints, floats, strs = [], [], [], []
+    for v in values:
+        if v is None:
+            kind = _NONE
+        elif isinstance(v, (bool, np.bool_)):
+            kind = _BOOL
+        elif isinstance(v, (int, np.integer)):
+            kind = _INT
+        elif isinstance(v, (float, np.floating)):
+            kind = _FLOAT
+        elif isinstance(v, str):
+            kind = _STR
+        else:
+            raise TypeError('Values of type %s cannot be cached' % type(v).__name__)
+        kinds.append(kind)
+        ints.append(int(v) if kind in (_INT, _BOOL) else 0)
+        floats.append(float(v) if kind == _FLOAT else 0.0)
+        strs.append(v if kind == _STR else '')
+    arrays[name + '.kind'] = np.array(kinds, dtype = np.int8)
+    arrays[name + '.int'] = np.array(ints, dtype = np.int64)
+    arrays[name + '.float'] = np.array(floats, dtype = np.float64)
+    arrays[name + '.str'] = np.array(strs, dtype = str)
+
+
+def _decode(arrays, name):
+    values = []
+    for kind, i, x, text in zip(arrays[name + '.kind'], arrays[name + '.int'], arrays[name + '.float'], arrays[name + '.str']):
+        if kind == _NONE:
+            values.append(None)
+        elif kind == _BOOL:
+            values.append(bool(i))
+        elif kind == _INT:
+            values.append(int(i))
+        elif kind == _FLOAT:
+            values.append(float(x))
+        else:
+            values.append(str(text))
+    return values
+
+
+#Arrays of an entry: for every table its columns, and for every cell the position of its column, its key and its value
+def _inputs_arrays(inputs):
+    arrays = {}
+    for name in SHEET_BLOCKS:
+        table = getattr(inputs, name)
+        _encode(arrays, name + '.columns', list(table))
+        arrays[name + '.cell_column'] = np.array([j for j, column in enumerate(table.values()) for _ in column], dtype = np.int64)
+        _encode(arrays, name + '.keys', [k for column in table.values() for k in column])
+        _encode(arrays, name + '.values', [v for column in table.values() for v in column.values()])
+    _encode(arrays, 'scalars', [getattr(inputs, name) for name in SCALAR_CELLS])
+    return arrays
+
+
+#Rebuild the PlanningInputs object of an entry
+def _arrays_inputs(arrays):
+    data = {}
+    for name in SHEET_BLOCKS:
+        columns = _decode(arrays, name + '.columns')
+        table = {column: {} for column in columns}
+        for j, k, v in zip(arrays[name + '.cell_column'], _decode(arrays, name + '.keys'), _decode(arrays, name + '.values')):
+            table[columns[j]][k] = v
+        data[name] = table
+    data.update(zip(SCALAR_CELLS, _decode(arrays, 'scalars')))
+    return PlanningInputs(**data)
+
+
+#Load the workbook through the cache, parsing it with openpyxl only on a cache miss
+def load_cached_workbook_data(file_name, cache_dir = None, max_bytes = MAX_BYTES, max_age = MAX_AGE):
+    cache_dir = cache_dir or os.path.join(CACHE_DIR, 'inputs')
+    key = workbook_key(file_name)
+    path = os.path.join(cache_dir, key + '.npz')
+
+    if os.path.exists(path):
+        try:
+            with np.load(path, allow_pickle = False) as arrays:
+                inputs = _arrays_inputs(arrays)
+            os.utime(path)
+            return inputs
+        except Exception:
+            _remove(path)
+
+    inputs = load_workbook_data(file_name)
+    try:
+        arrays = _inputs_arrays(inputs)
+    except TypeError:
+        return inputs
+
+    #Write to a temporary file first so that concurrent runs never read a partially written entry
+    try:
+        os.makedirs(cache_dir, exist_ok = True)
+        fd, tmp = tempfile.mkstemp(dir = cache_dir, suffix = '.tmp')
+    except OSError:
+        return inputs
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        os.replace(tmp, path)
+    except OSError:
+        _remove(tmp)
+        return inputs
+    evict(cache_dir, max_bytes, max_age)
+
+    return inputs
@@ -0,0 +1,102 @@
+'''
+Created on 18th October 2026
+
+LP relaxation screening of candidate policies
+
+Solving the complete MILP of every candidate policy is too slow when
+hundreds of them are screened before the shortlist is solved exactly. The
+screening mode solves only the LP relaxation of multiperiod_energy_planning,
+with every selection relaxed to [0, 1], and reports
+
+    - the bound: the optimum of the relaxation, which no plan can beat
+    - the total cost and emission of the relaxed solution
+    - a heuristic plan: the selections of the relaxed solution are rounded
+      and completed by the LP repair of MIP_Start, which gives a feasible
+      plan with its cost and emission, or none if the repair fails
+
+Selections are rounded up from ROUND_UP, so any technology the relaxation
+deploys by more than a trace stays available to the plan. The heuristic plan
+is left in the model.
+
+'''
+import time
+from dataclasses import dataclass
+
+import pandas as pd
+import pyomo.environ as pyo
+
+from MIP_Start import repair_mip_start
+from Model_Presolve import presolve, undo_presolve
+from Model_Template import TemplateCache
+from Scenario_Sweep import apply_overrides
+from Solver_Backends import solve_with_backend
+
+
+#Relaxed selections from this value upwards are rounded up to 1 in the heuristic plan
+ROUND_UP = 1e-3
+
+
+@dataclass
+class ScreeningReport:
+    termination_condition: str
+    bound: float = None
+    cost: float = None
+    emission: float = None
+
+    #Status of the repair of the rounded plan, see MIP_Start.MipStartReport
+    plan_status: str = None
+    plan_cost: float = None
+    plan_emission: float = None
+    seconds: float = 0.0
+
+    def __str__(self):
+        return ('LP bound %s (cost %s, emission %s), rounded plan %s (cost %s, emission %s) in %.2f s'
+                % (self.bound, self.cost, self.emission, self.plan_status, self.plan_cost, self.plan_emission, self.seconds))
+
+
+def _totals(model):
+    return sum(pyo.value(model.sum_cost[i]) for i in model.periods), sum(pyo.value(model.new_emission[i]) for i in model.periods)
+
+
+#Solve the LP relaxation of a built model and round it to a heuristic plan
+def lp_screen(model, backend = None, time_limit = None, round_up = ROUND_UP, plan = True):
+    start = time.perf_counter()
+    presolve(model)
+    binaries = [v for v in model.component_data_objects(pyo.Var) if v.is_binary() and not v.fixed]
+    for v in binaries:
+        v.domain = pyo.UnitInterval
+    try:
+        results = solve_with_backend(model, backend, time_limit)
+    finally:
+        for v in binaries:
+            v.domain = pyo.Binary
+        undo_presolve(model)
+
+    condition = results.solver.termination_condition
+    report = ScreeningReport(str(condition))
+    if condition == pyo.TerminationCondition.optimal:
+        report.bound = pyo.value(model.obj)
+        report.cost, report.emission = _totals(model)
+
+        if plan:
+            for v in binaries:
+                v.set_value(1 if v.value is not None and v.value >= round_up else 0)
+            report.plan_status = repair_mip_start(model, time_limit = time_limit).status
+            if report.plan_status != 'failed':
+                report.plan_cost, report.plan_emission = _totals(model)
+
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+#Screen the scenarios, a list of (name, overrides) as in Scenario_Sweep, returning a table with one row per scenario
+#Scenarios of the same structure share one built model, so each scenario only costs its LP solves
+def screen_scenarios(inputs, scenarios, model_module = 'Optimal_Decarbonisation_Model_Python', backend = None, time_limit = None, round_up = ROUND_UP, plan = True):
+    import importlib
+    cache = TemplateCache(importlib.import_module(model_module).build_model)
+    rows = []
+    for name, overrides in scenarios:
+        model = cache.model_for(apply_overrides(inputs, overrides))
+        report = lp_screen(model, backend, time_limit, round_up, plan)
+        rows.append(dict(scenario = name, **vars(report)))
+    return pd.DataFrame(rows).set_index('scenario')
@@ -0,0 +1,183 @@
+'''
+Created on 18th October 2026
+
+MIP starts from the solution of a related scenario
+
+Neighbouring scenarios of a sweep usually share most of their binary
+decisions, so the solution of one scenario is a good incumbent for the next.
+set_mip_start copies the selections A, B, D, J, O and Q (and T of the Industry
+model) and the continuous deployments of a prior solution into a model, taking the
+solution either from the solve cache (see Solve_Cache) or from the tidy
+results of a previous run (see Results_Store). Pairs that do not exist in the
+sparse index sets of the new model are skipped, selections are rounded and
+every value is clipped to the bounds of its variable.
+
+The copied values rarely satisfy every constraint of the new scenario, and
+the solvers discard a start that is infeasible. repair_mip_start therefore
+fixes the selections and solves the remaining LP with HiGHS, whatever the
+backend of the MIP solve (as in the LP bound pass of Big_M_Bounds), which
+fills in all other variables consistently. If the selections are infeasible
+for the new data, e.g. because the emission limit is tighter, every NETs and
+compensatory energy selection that the data allows is switched on and the LP
+is solved again. If that does not help either, the selections closest to the
+start are found by minimising the number of changed selections. The repaired
+solution is left in the model, ready for a solve with warmstart = True.
+
+'''
+from dataclasses import dataclass
+
+import pyomo.environ as pyo
+from pyomo.common.collections import ComponentMap
+
+from Model_Presolve import presolve, undo_presolve
+from Results_Store import PLANT_VARIABLES, OPTION_VARIABLES, PERIOD_VARIABLES, PERIOD_OPTION_VARIABLES
+
+
+#Selections of the technologies, which make up the MIP start together with the deployments
+SELECTION_VARIABLES = ('A', 'B', 'D', 'J', 'O', 'Q', 'T')
+
+#Continuous deployments of the technologies
+DEPLOYMENT_VARIABLES = ('energy', 'CCS', 'solid', 'gas', 'NET', 'REN', 'electricity')
+
+#Selections that only allow the deployment of NETs, compensatory energy or purchased electricity, switched on by the repair
+ENABLING_VARIABLES = ('D', 'J', 'T')
+
+
+@dataclass
+class MipStartReport:
+    #'complete' if the start was feasible as given, 'repaired' if the enabling selections had to be switched on, otherwise 'failed'
+    status: str
+
+    #Number of variables given a start value
+    values_set: int
+
+    #Number of selections changed by the repair
+    selections_changed: int = 0
+
+    def __str__(self):
+        return 'MIP start %s (%d values set, %d selections changed by the repair)' % (self.status, self.values_set, self.selections_changed)
+
+
+#Solution of the tidy results table of one scenario, as written by Results_Store, in the {component name: {index: value}} layout of Solve_Cache
+#The values of a catalogue option are listed under every variable of its kind, e.g. a plant selection under B, O and Q, as only
+#the variable of its technology class is indexed by the option
+def solution_from_tidy(table):
+    names = {key: [name] for name, key in PLANT_VARIABLES.items()}
+    names.update({key: [name] for name, key in PERIOD_VARIABLES.items()})
+    options = {}
+    for variables, by_plant in ((OPTION_VARIABLES, True), (PERIOD_OPTION_VARIABLES, False)):
+        for name, variable in variables.items():
+            options.setdefault((by_plant, variable), []).append(name)
+    if table['scenario'].nunique() > 1:
+        raise ValueError('The results table holds more than one scenario')
+
+    solution = {}
+    for period, plant, technology, variable, value in zip(table['period'], table['plant'], table['technology'], table['variable'], table['value']):
+        if (technology, variable) in names:
+            index = (int(period), plant) if plant else int(period)
+            candidates = names[technology, variable]
+        else:
+            index = (int(period), plant, technology) if plant else (int(period), technology)
+            candidates = options[bool(plant), variable]
+        for name in candidates:
+            solution.setdefault(name, {})[index] = value
+    return solution
+
+
+#Copy the selections and deployments of a prior solution into the variables of the model
+def set_mip_start(model, solution):
+    values_set = 0
+    for name in SELECTION_VARIABLES + DEPLOYMENT_VARIABLES:
+        var = getattr(model, name, None)
+        if var is None or name not in solution:
+            continue
+        for index, value in solution[name].items():
+            if index not in var or value is None or value != value or var[index].fixed:
+                continue
+            v = var[index]
+            if v.is_binary():
+                value = round(value)
+            if v.lb is not None:
+                value = max(value, v.lb)
+            if v.ub is not None:
+                value = min(value, v.ub)
+            v.set_value(value)
+            values_set += 1
+    return values_set
+
+
+#Solve the model with HiGHS, loading the best solution found if there is one
+def _solve_highs(model, time_limit):
+    from pyomo.contrib.appsi.solvers import Highs
+    opt = Highs()
+    if not opt.available():
+        raise RuntimeError("Solver backend 'highs' is not available on this machine")
+    opt.config.load_solution = False
+    if time_limit is not None:
+        opt.config.time_limit = time_limit
+    results = opt.solve(model)
+    if results.best_feasible_objective is None:
+        return False
+    results.solution_loader.load_vars()
+    return True
+
+
+#Selections closest to the start that are feasible for the model, found by minimising the number of changed selections
+def _closest_selections(model, selections, start, time_limit):
+    objectives = list(model.component_data_objects(pyo.Objective, active = True))
+    for obj in objectives:
+        obj.deactivate()
+    model.repair_obj = pyo.Objective(expr = sum(1 - v if start[v] else v for v in selections), sense = pyo.minimize)
+    try:
+        return _solve_highs(model, time_limit)
+    finally:
+        model.del_component(model.repair_obj)
+        for obj in objectives:
+            obj.activate()
+
+
+#Complete the start in the model by solving the LP over the continuous variables with the selections fixed
+#If the selections are infeasible, the enabling selections are switched on, and failing that the fewest selections are changed
+def repair_mip_start(model, values_set = 0, time_limit = None):
+    presolve(model)
+    selections = [v for name in SELECTION_VARIABLES if hasattr(model, name) for v in getattr(model, name).values() if not v.fixed]
+    start = ComponentMap((v, round(v.value) if v.value is not None else 0) for v in selections)
+    try:
+        for v in selections:
+            v.fix(start[v])
+        if _solve_highs(model, time_limit):
+            return MipStartReport('complete', values_set)
+
+        #The enabling selections only add deployment options, so switching them on can only help the LP
+        enabled = 0
+        for name in ENABLING_VARIABLES:
+            if not hasattr(model, name):
+                continue
+            for v in getattr(model, name).values():
+                if v in start and v.value != 1:
+                    v.fix(1)
+                    enabled += 1
+        if enabled and _solve_highs(model, time_limit):
+            return MipStartReport('repaired', values_set, enabled)
+
+        for v in selections:
+            v.unfix()
+        if _closest_selections(model, selections, start, time_limit):
+            for v in selections:
+                v.fix(round(v.value))
+            if _solve_highs(model, time_limit):
+                return MipStartReport('repaired', values_set, sum(1 for v in selections if v.value != start[v]))
+
+        for v in selections:
+            v.set_value(start[v])
+        return MipStartReport('failed', values_set)
+    finally:
+        for v in selections:
+            v.unfix()
+        undo_presolve(model)
+
+
+#Set and repair a MIP start from a prior solution, {component name: {index: value}}, e.g. Solve_Cache.cached_solution or solution_from_tidy
+#The MipStartReport is returned for the caller to print or log
+def mip_start(model, solution, time_limit = None):
+    return repair_mip_start(model, set_mip_start(model, solution), time_limit)
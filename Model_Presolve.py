@@ -0,0 +1,178 @@
+'''
+Created on 18th October 2026
+
+Presolve stage for the DECO2 energy planning models
+
+Many rows of multiperiod_energy_planning only fix a single variable from the
+input data, for example the technology implementation times of the NETs and
+compensatory energy (D[i,k] == 0 when TIME is 'NO') or the CO2 intensity with
+CCS (CI_RET[i,s,k] equal to a constant). Others are already implied by the
+variable domain.
+
+The presolve turns every row with at most one free variable into a fixed
+variable or a variable bound and deactivates it, then revisits the rows that
+contained a newly fixed variable until nothing changes. The solver
+therefore receives fewer rows and columns. undo_presolve restores the model
+afterwards, keeping the variable values, so the model can be updated with new
+data and presolved again.
+
+'''
+import math
+from dataclasses import dataclass
+
+import pyomo.environ as pyo
+from pyomo.core.expr.visitor import identify_mutable_parameters
+from pyomo.repn import generate_standard_repn
+
+
+#Absolute tolerance used when comparing bounds
+TOL = 1e-9
+
+
+@dataclass
+class PresolveReport:
+    rows_before: int
+    rows_after: int
+    columns_before: int
+    columns_after: int
+    binaries_before: int
+    binaries_after: int
+    fixed_variables: int
+    tightened_bounds: int
+
+    def __str__(self):
+        return ('Presolve removed %d of %d rows, %d of %d columns and %d of %d binaries (%d variables fixed, %d bounds tightened)'
+                % (self.rows_before - self.rows_after, self.rows_before, self.columns_before - self.columns_after, self.columns_before,
+                   self.binaries_before - self.binaries_after, self.binaries_before, self.fixed_variables, self.tightened_bounds))
+
+
+def _has_mutable_params(con):
+    for expr in (con.body, con.lower, con.upper):
+        if expr is not None and next(iter(identify_mutable_parameters(expr)), None) is not None:
+            return True
+    return False
+
+
+#Tighten the bounds of v to lb <= v <= ub, fixing it if both bounds meet, and return whether it was fixed
+def _apply_bounds(v, lb, ub, record):
+    if v.is_integer():
+        lb = None if lb is None else math.ceil(lb - TOL)
+        ub = None if ub is None else math.floor(ub + TOL)
+
+    if id(v) not in record['bounds']:
+        record['bounds'][id(v)] = (v, v.lb, v.ub)
+
+    if lb is not None and ub is not None and abs(ub - lb) <= TOL:
+        v.fix(lb)
+        record['fixed'].append(v)
+        return True
+    if lb is not None and (v.lb is None or lb > v.lb + TOL):
+        v.setlb(lb)
+        record['tightened'] += 1
+    if ub is not None and (v.ub is None or ub < v.ub - TOL):
+        v.setub(ub)
+        record['tightened'] += 1
+    return False
+
+
+#Deactivate the row if it has at most one free variable, returning the variable it fixed if any
+def _presolve_row(con, repn, record, keep_parameter_rows):
+    terms = [(v, c) for v, c in zip(repn.linear_vars, repn.linear_coefs) if not v.fixed and c != 0]
+    if len(terms) > 1:
+        return None
+    if keep_parameter_rows and _has_mutable_params(con):
+        return None
+
+    lower = None if con.lower is None else pyo.value(con.lower) - repn.constant
+    upper = None if con.upper is None else pyo.value(con.upper) - repn.constant
+
+    if not terms:
+        #A violated constant row is left for the solver to report as infeasible
+        if (lower is not None and lower > TOL) or (upper is not None and upper < -TOL):
+            return None
+        con.deactivate()
+        record['rows'].append(con)
+        return None
+
+    v, coef = terms[0]
+    lb = None if lower is None else lower / coef
+    ub = None if upper is None else upper / coef
+    if coef < 0:
+        lb, ub = ub, lb
+    if (lb is not None and v.ub is not None and lb > v.ub + TOL) or (ub is not None and v.lb is not None and ub < v.lb - TOL):
+        return None
+
+    con.deactivate()
+    record['rows'].append(con)
+    if _apply_bounds(v, lb, ub, record):
+        return v
+    return None
+
+
+def _size(model, row_vars):
+    rows = sum(1 for con in row_vars if con.active)
+    columns = {}
+    for con, variables in row_vars.items():
+        if con.active:
+            for v in variables:
+                if not v.fixed:
+                    columns[id(v)] = v
+    binaries = sum(1 for v in columns.values() if v.is_binary())
+    return rows, len(columns), binaries
+
+
+#Presolve the model in place and return a PresolveReport
+#With keep_parameter_rows, rows that depend on mutable parameters are left alone, so that a persistent solver can keep updating them
+def presolve(model, keep_parameter_rows = False):
+    if getattr(model, 'presolve_record', None) is not None:
+        undo_presolve(model)
+    record = {'rows': [], 'fixed': [], 'bounds': {}, 'tightened': 0}
+
+    row_vars = {}
+    var_rows = {}
+    repns = []
+    for con in model.component_data_objects(pyo.Constraint, active = True, descend_into = True):
+        repn = generate_standard_repn(con.body, compute_values = True, quadratic = False)
+        if repn.nonlinear_expr is not None:
+            continue
+        repns.append((con, repn))
+        row_vars[con] = [v for v, c in zip(repn.linear_vars, repn.linear_coefs) if c != 0]
+        for v in row_vars[con]:
+            var_rows.setdefault(id(v), []).append(con)
+    before = _size(model, row_vars)
+    free = {con: len(variables) for con, variables in row_vars.items()}
+
+    #First pass over every row, then only over the rows left with at most one free variable by the fixings of the previous pass
+    while repns:
+        fixed = []
+        for con, repn in repns:
+            if con.active:
+                v = _presolve_row(con, repn, record, keep_parameter_rows)
+                if v is not None:
+                    fixed.append(v)
+        pending = {}
+        for v in fixed:
+            for con in var_rows.get(id(v), []):
+                free[con] -= 1
+                if con.active and free[con] <= 1:
+                    pending[id(con)] = con
+        repns = [(con, generate_standard_repn(con.body, compute_values = True, quadratic = False)) for con in pending.values()]
+
+    model.presolve_record = record
+    after = _size(model, row_vars)
+    return PresolveReport(before[0], after[0], before[1], after[1], before[2], after[2], len(record['fixed']), record['tightened'])
+
+
+#Reactivate the presolved rows and restore the original bounds, keeping the current variable values
+def undo_presolve(model):
+    record = getattr(model, 'presolve_record', None)
+    if record is None:
+        return
+    for v in record['fixed']:
+        v.unfix()
+    for v, lb, ub in record['bounds'].values():
+        v.setlb(lb)
+        v.setub(ub)
+    for con in record['rows']:
+        con.activate()
+    model.presolve_record = None
@@ -0,0 +1,168 @@
+'''
+Created on 18th October 2026
+
+Size and structure report of the built planning model
+
+model_size_report reads the rows of a model built by
+multiperiod_energy_planning once and reports for every Cons_* family and
+every variable family:
+
+    rows            active rows of the constraint family
+    columns         variables in the rows of a constraint family, or the
+                    variables of a variable family
+    nonzeros        nonzero coefficients
+    binaries        binary variables among the columns
+    min_coefficient smallest and largest absolute nonzero coefficient
+    max_coefficient
+    duplicates      rows that repeat an earlier row of the model, up to
+                    scaling
+    trivial         rows that hold for every value within the variable
+                    bounds, e.g. energy >= 0 from plant_commission, including
+                    rows without any variables
+    unused          variables that appear in no active row
+
+The report is a table with one row per family, and compare_model_size
+compares it with the report of an earlier version to gate deployments on
+size regressions.
+
+Run from the command line, e.g.
+
+    python Model_Size.py --workbook Optimal_Decarbonisation_User_Interface.xlsx --output size.csv --baseline size_baseline.csv
+
+'''
+import argparse
+import importlib
+import math
+import sys
+
+import pandas as pd
+import pyomo.environ as pyo
+from pyomo.repn import generate_standard_repn
+
+from Model_Presolve import TOL
+from Workbook_Loader import default_workbook
+
+
+#Columns of the report in which a growth beyond the tolerance counts as a regression
+SIZE_COLUMNS = ['rows', 'columns', 'nonzeros', 'binaries', 'duplicates', 'trivial', 'unused']
+
+#Significant digits of the coefficients compared to find duplicate rows
+DIGITS = 10
+
+
+#Key of a row that is the same for all rows that are equal up to scaling
+def _row_key(terms, lower, upper):
+    terms = sorted(terms, key = lambda term: id(term[0]))
+    scale = max(abs(c) for _, c in terms)
+    if terms[0][1] < 0:
+        scale = -scale
+        lower, upper = upper, lower
+    key = tuple((id(v), round(c / scale, DIGITS)) for v, c in terms)
+    return (key, None if lower is None else round(lower / scale, DIGITS), None if upper is None else round(upper / scale, DIGITS))
+
+
+#Whether lower <= sum of the terms <= upper holds for every value of the variables within their bounds
+def _is_trivial(terms, lower, upper):
+    low, high = 0.0, 0.0
+    for v, c in terms:
+        lb = -math.inf if v.lb is None else v.lb
+        ub = math.inf if v.ub is None else v.ub
+        low += c * lb if c > 0 else c * ub
+        high += c * ub if c > 0 else c * lb
+    return (lower is None or low >= lower - TOL) and (upper is None or high <= upper + TOL)
+
+
+#Report of the size and structure of a built model, with one row per constraint and variable family
+def model_size_report(model):
+    rows = []
+    seen = set()
+    used = {}
+    for con in model.component_objects(pyo.Constraint, active = True):
+        stats = {'family': con.local_name, 'kind': 'Constraint', 'rows': 0, 'nonzeros': 0, 'duplicates': 0, 'trivial': 0}
+        columns = {}
+        coefficients = []
+        for row in con.values():
+            if not row.active:
+                continue
+            stats['rows'] += 1
+            repn = generate_standard_repn(row.body, compute_values = True, quadratic = False)
+            terms = [(v, c) for v, c in zip(repn.linear_vars, repn.linear_coefs) if c != 0]
+            lower = None if row.lower is None else pyo.value(row.lower) - repn.constant
+            upper = None if row.upper is None else pyo.value(row.upper) - repn.constant
+            stats['nonzeros'] += len(terms)
+            for v, c in terms:
+                columns[id(v)] = v
+                used.setdefault(id(v), []).append(abs(c))
+                coefficients.append(abs(c))
+            if _is_trivial(terms, lower, upper):
+                stats['trivial'] += 1
+            if terms:
+                key = _row_key(terms, lower, upper)
+                if key in seen:
+                    stats['duplicates'] += 1
+                seen.add(key)
+        stats['columns'] = len(columns)
+        stats['binaries'] = sum(1 for v in columns.values() if v.is_binary())
+        stats['min_coefficient'] = min(coefficients, default = None)
+        stats['max_coefficient'] = max(coefficients, default = None)
+        rows.append(stats)
+
+    for var in model.component_objects(pyo.Var):
+        variables = list(var.values())
+        coefficients = [c for v in variables for c in used.get(id(v), [])]
+        rows.append({'family': var.local_name, 'kind': 'Var', 'rows': 0, 'columns': len(variables), 'nonzeros': len(coefficients),
+                     'binaries': sum(1 for v in variables if v.is_binary()), 'duplicates': 0, 'trivial': 0,
+                     'unused': sum(1 for v in variables if id(v) not in used),
+                     'min_coefficient': min(coefficients, default = None), 'max_coefficient': max(coefficients, default = None)})
+
+    report = pd.DataFrame(rows, columns = ['family', 'kind'] + SIZE_COLUMNS + ['min_coefficient', 'max_coefficient'])
+    report['unused'] = report['unused'].fillna(0).astype(int)
+    return report.set_index('family')
+
+
+#Totals of a report over the constraint families, which count every row and nonzero once, and the variable families
+def size_totals(report):
+    constraints = report[report['kind'] == 'Constraint']
+    variables = report[report['kind'] == 'Var']
+    return {'rows': int(constraints['rows'].sum()), 'columns': int(variables['columns'].sum()), 'nonzeros': int(constraints['nonzeros'].sum()),
+            'binaries': int(variables['binaries'].sum()), 'duplicates': int(constraints['duplicates'].sum()),
+            'trivial': int(constraints['trivial'].sum()), 'unused': int(variables['unused'].sum()),
+            'min_coefficient': report['min_coefficient'].min(), 'max_coefficient': report['max_coefficient'].max()}
+
+
+#Families whose size grew by more than the relative tolerance compared to the baseline report, or that are new,
+#as a table of the baseline and current value of every grown size column
+def compare_model_size(report, baseline, tolerance = 0.0):
+    rows = []
+    for family, stats in report.iterrows():
+        for column in SIZE_COLUMNS:
+            value = stats[column]
+            before = baseline[column].get(family) if family in baseline.index else None
+            if before is None or pd.isna(before):
+                if family not in baseline.index and value:
+                    rows.append({'family': family, 'column': column, 'baseline': None, 'current': value})
+            elif value > before * (1 + tolerance) + TOL:
+                rows.append({'family': family, 'column': column, 'baseline': before, 'current': value})
+    return pd.DataFrame(rows, columns = ['family', 'column', 'baseline', 'current'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Report the size and structure of the energy planning model')
+    parser.add_argument('--model', default = 'Optimal_Decarbonisation_Model_Python')
+    parser.add_argument('--workbook', default = None, help = 'user interface workbook, by default the example workbook of the model')
+    parser.add_argument('--output', default = None, help = 'CSV of the report')
+    parser.add_argument('--baseline', default = None, help = 'CSV of an earlier report; the exit status is 1 if any family grew')
+    parser.add_argument('--tolerance', type = float, default = 0.0, help = 'relative growth allowed over the baseline')
+    args = parser.parse_args()
+
+    module = importlib.import_module(args.model)
+    report = model_size_report(module.build_model(module.load_inputs(args.workbook or default_workbook(module))))
+    print(report.to_string())
+    print(size_totals(report))
+    if args.output is not None:
+        report.to_csv(args.output)
+    if args.baseline is not None:
+        regressions = compare_model_size(report, pd.read_csv(args.baseline, index_col = 'family'), args.tolerance)
+        if len(regressions):
+            print(regressions.to_string(index = False))
+            sys.exit(1)
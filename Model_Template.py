@@ -0,0 +1,95 @@
+'''
+Created on 18th October 2026
+
+Mutable-parameter model templates
+
+Every numeric value read from the user interface workbook is held in a
+mutable Pyomo parameter instead of being baked into the expressions as a
+constant:
+
+    p_plant[s, column]      LB, UB and CI of power plant s
+    p_<table>[i, column]    every period table, e.g. p_fuel[i, 'COAL']
+    p_AFF                   annualisation factor
+
+The structure of the model only depends on the plant set and the plant
+fuel types, commissioning periods, the number of periods, the objective flag
+and the technology implementation times. Scenarios that share this structure
+can therefore reuse one built model and just overwrite the parameter values
+with update_model, instead of rebuilding every constraint family.
+
+'''
+import copy
+
+import pyomo.environ as pyo
+
+from Big_M_Bounds import update_big_m
+
+
+#Period data tables that are held in mutable parameters named p_<table>
+PERIOD_TABLES = ('EP', 'fuel', 'REN_CI', 'REN_COST', 'CPX_1', 'CPX_2', 'SLD_CI', 'SLD_COST', 'GAS_CI', 'GAS_COST', 'CCS_data', 'NET_CI', 'NET_COST')
+
+#Numeric plant data held in the mutable parameter p_plant, all other plant data is structural
+PLANT_COLUMNS = ('LB', 'UB', 'CI')
+
+
+#Mutable parameter indexed by (period, column) holding the values of a period data table
+def period_param(table, i):
+    return pyo.Param(i, list(table), initialize = {(p, c): table[c][p] for p in i for c in table}, mutable = True)
+
+
+#Mutable parameter indexed by (plant, column) holding the numeric plant data
+def plant_param(plant):
+    return pyo.Param(list(plant), PLANT_COLUMNS, initialize = {(s, c): plant[s][c] for s in plant for c in PLANT_COLUMNS}, mutable = True)
+
+
+#Everything in the inputs that determines the structure of the model rather than its coefficients
+def structure_key(inputs):
+    plants = [(s, [(c, v) for c, v in data.items() if c not in PLANT_COLUMNS]) for s, data in inputs.plant.items()]
+    columns = [(name, list(getattr(inputs, name))) for name in PERIOD_TABLES]
+    time = [(c, sorted(col.items())) for c, col in inputs.TIME.items()]
+    return repr((plants, columns, time, inputs.numperiods, inputs.flag))
+
+
+#Overwrite the data of a built model with the values of another scenario with the same structure, keeping copies of its tables
+def update_model(model, inputs):
+    if structure_key(inputs) != model.structure:
+        raise ValueError('The inputs do not have the same structure as the model, so the model has to be rebuilt')
+
+    for name in PERIOD_TABLES:
+        table = getattr(inputs, name)
+        param = getattr(model, 'p_' + name)
+        for (p, c) in param:
+            param[p, c] = table[c][p]
+        setattr(model, name, copy.deepcopy(table))
+
+    for (s, c) in model.p_plant:
+        model.p_plant[s, c] = inputs.plant[s][c]
+    model.plant = copy.deepcopy(inputs.plant)
+
+    model.p_AFF = inputs.AFF
+    model.AFF = inputs.AFF
+
+    #The big M values are derived from the data, so they are recomputed as well
+    update_big_m(model)
+    return model
+
+
+#Built models kept by structure, so each plant topology is only built once
+class TemplateCache:
+    def __init__(self, build_model, max_models = 8):
+        self.build_model = build_model
+        self.max_models = max_models
+        self.models = {}
+
+    #Return a model holding the given inputs, reusing and updating a cached model of the same structure if there is one
+    def model_for(self, inputs):
+        key = structure_key(inputs)
+        if key in self.models:
+            model = self.models.pop(key)
+            update_model(model, inputs)
+        else:
+            model = self.build_model(inputs)
+        self.models[key] = model
+        while len(self.models) > self.max_models:
+            del self.models[next(iter(self.models))]
+        return model
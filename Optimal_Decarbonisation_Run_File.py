@@ -15,4 +15,14 @@ path = os.chdir(r'COPY_PATHNAME_ AND_REPLACE_THIS_TEXT')
 
 cwd = os.getcwd()
 
-import Optimal_Decarbonisation_Model_Python
\ No newline at end of file
+from Optimal_Decarbonisation_Model_Python import file_name, load_inputs, build_model, solve, extract_results, write_results
+
+inputs = load_inputs(file_name)
+
+model = build_model(inputs)
+
+results = solve(model)
+
+'''
+write_results(extract_results(model), file_name)
+'''
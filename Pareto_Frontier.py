@@ -0,0 +1,163 @@
+'''
+Created on 18th October 2026
+
+Epsilon-constraint Pareto frontier of cost against emission
+
+The flag of the user interface selects one of two corner points of the
+trade-off between cost and CO2 emission: min_budget minimises the total cost
+subject to the emission limits, the other objective minimises the total
+emission subject to the budgets. The frontier mode traces the whole curve
+between the two corners.
+
+The model of a frontier has an objective weighting the total cost and the
+total emission, and an epsilon constraint bounding the total emission over
+all periods. Both are held in mutable parameters, so every point is a
+re-solve of the same model in a persistent solver (see Persistent_Session).
+
+    - the minimum emission corner minimises the total emission, followed by
+      the total cost at that emission
+    - the minimum cost corner minimises the total cost without bounding the
+      emission
+    - the points in between minimise the total cost with the total emission
+      bounded by epsilon, for epsilon between the two corners
+
+The points are solved in order of increasing epsilon, so the solution of one
+point is feasible for the next and is passed to the solver as a MIP start.
+The epsilon values are split into contiguous chunks that are solved in
+parallel worker processes, each chunk starting from the minimum emission
+corner.
+
+By default the emission limits or budgets of the individual periods are
+relaxed, so that the frontier covers the complete trade-off.
+
+'''
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import pyomo.environ as pyo
+
+from Persistent_Session import PlanningSession
+
+
+#Bound of the total emission treated as infinite by the solvers
+NO_LIMIT = 1e20
+
+#Relative and absolute tolerance on the total emission of the minimum emission corner
+EPSILON_TOL = 1e-6
+
+
+@dataclass
+class FrontierPoint:
+    #Bound of the total emission, or None for the minimum cost corner
+    epsilon: float
+    cost: float
+    emission: float
+    status: str
+    seconds: float
+
+
+#Add the weighted objective and the epsilon constraint of the frontier to a built model
+def add_frontier(model, period_constraints = False):
+    periods = model.periods
+    model.obj.deactivate()
+    if not period_constraints:
+        model.Cons_70.deactivate()
+
+    model.p_cost_weight = pyo.Param(initialize = 1, mutable = True)
+    model.p_emission_weight = pyo.Param(initialize = 0, mutable = True)
+    model.p_epsilon = pyo.Param(initialize = NO_LIMIT, mutable = True)
+
+    model.total_cost = pyo.Expression(expr = sum(model.sum_cost[i] for i in periods))
+    model.total_emission = pyo.Expression(expr = sum(model.new_emission[i] for i in periods))
+    model.frontier_obj = pyo.Objective(expr = model.p_cost_weight * model.total_cost + model.p_emission_weight * model.total_emission, sense = pyo.minimize)
+    model.epsilon_constraint = pyo.Constraint(expr = model.total_emission <= model.p_epsilon)
+    return model
+
+
+def _variables(model):
+    return list(model.component_data_objects(pyo.Var, sort = True))
+
+
+#Values of every variable of a model, to pass a solution on to another copy of the same model
+def solution_values(model):
+    return [v.value for v in _variables(model)]
+
+
+def load_solution_values(model, values):
+    variables = _variables(model)
+    if len(values) != len(variables):
+        raise ValueError('The solution does not belong to a model of the same structure')
+    for v, value in zip(variables, values):
+        if not v.fixed:
+            v.set_value(value, skip_validation = True)
+
+
+def _session(module, inputs, period_constraints, session_options):
+    model = add_frontier(module.build_model(inputs), period_constraints)
+    return PlanningSession(model, warmstart = True, **session_options)
+
+
+def _solve_point(session, epsilon, cost_weight, emission_weight):
+    model = session.model
+    start = time.perf_counter()
+    model.p_epsilon = NO_LIMIT if epsilon is None else epsilon
+    model.p_cost_weight = cost_weight
+    model.p_emission_weight = emission_weight
+    results = session.solve()
+    if results.best_feasible_objective is None:
+        return FrontierPoint(epsilon, None, None, results.termination_condition.name, time.perf_counter() - start)
+    return FrontierPoint(epsilon, pyo.value(model.total_cost), pyo.value(model.total_emission), results.termination_condition.name, time.perf_counter() - start)
+
+
+#Solve the points of one chunk in order of increasing epsilon, each warm-started from the previous solution
+def _solve_chunk(model_module, inputs, epsilons, start_values, period_constraints, session_options):
+    import importlib
+    session = _session(importlib.import_module(model_module), inputs, period_constraints, session_options)
+    load_solution_values(session.model, start_values)
+    return [_solve_point(session, epsilon, 1, 0) for epsilon in epsilons]
+
+
+#Trace the frontier with the two corners and points more epsilon values in between, returning the FrontierPoints by increasing emission
+#With several workers, the points are solved in chunks, by default one per worker, with threads solver threads each
+def pareto_frontier(inputs, points = 10, model_module = 'Optimal_Decarbonisation_Model_Python', workers = 1, chunks = None, threads = None,
+                    backend = 'highs', time_limit = None, mip_gap = None, period_constraints = False):
+    import importlib
+    module = importlib.import_module(model_module)
+    session_options = dict(backend = backend, time_limit = time_limit, mip_gap = mip_gap, threads = threads)
+    session = _session(module, inputs, period_constraints, session_options)
+
+    #The minimum emission corner is solved lexicographically, so that it is not dominated by a cheaper solution with the same emission
+    lowest = _solve_point(session, None, 0, 1)
+    if lowest.emission is None:
+        raise RuntimeError('The minimum emission corner of the frontier could not be solved (%s)' % lowest.status)
+    epsilon_min = lowest.emission * (1 + EPSILON_TOL) + EPSILON_TOL
+    corner = _solve_point(session, epsilon_min, 1, 0)
+    corner.seconds += lowest.seconds
+    start_values = solution_values(session.model)
+
+    cheapest = _solve_point(session, None, 1, 0)
+    if cheapest.emission is None:
+        raise RuntimeError('The minimum cost corner of the frontier could not be solved (%s)' % cheapest.status)
+
+    epsilons = list(np.linspace(epsilon_min, cheapest.emission, points + 2)[1:-1])
+    chunks = min(len(epsilons), chunks or workers) or 1
+    parts = [list(part) for part in np.array_split(epsilons, chunks)]
+
+    #Without workers, all points are solved in the session of the corners, each warm-started from the previous point
+    if workers == 1:
+        load_solution_values(session.model, start_values)
+        frontier = [_solve_point(session, epsilon, 1, 0) for epsilon in epsilons]
+    else:
+        with ProcessPoolExecutor(max_workers = workers) as pool:
+            futures = [pool.submit(_solve_chunk, model_module, inputs, part, start_values, period_constraints, session_options) for part in parts]
+            frontier = [point for future in futures for point in future.result()]
+
+    return [corner] + frontier + [cheapest]
+
+
+#Frontier as a table with one row per point
+def frontier_table(frontier):
+    return pd.DataFrame([vars(point) for point in frontier])
@@ -0,0 +1,224 @@
+'''
+Created on 18th October 2026
+
+Lagrangian decomposition of the planning model by period
+
+The periods of multiperiod_energy_planning are only coupled by the
+constraints that keep a deployment from decreasing from one period to the
+next (Cons_6, Cons_12, Cons_16, Cons_18, Cons_55, Cons_60, and Cons_B to D
+of the Industry model), while the objective is a sum over the periods. The
+linking rows are found from the periods of their variables, so the engine
+works for every model variant.
+
+Every linking row is written as h(x) <= 0 and moved into the objective with
+a multiplier mu >= 0. What remains splits into one MILP per period, which
+are solved in parallel worker processes. The sum of their dual bounds plus
+the constant terms of the multipliers is a lower bound on the optimum for
+any mu >= 0, and the multipliers are improved with subgradient steps.
+
+Upper bounds come from the period solutions: the selections they choose are
+turned into a feasible plan of the complete model by the repair of MIP_Start,
+and the best plan found is left in the model. The engine stops when the gap
+between the bounds is closed or after max_iterations.
+
+'''
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import pyomo.environ as pyo
+from pyomo.core.expr.visitor import identify_variables
+from pyomo.repn import generate_standard_repn
+
+from MIP_Start import repair_mip_start
+from Rolling_Horizon import index_period
+from Solve_Cache import model_solution
+
+
+#Subgradient step factor to start with, halved whenever the lower bound has not improved for STALL_ITERATIONS
+STEP_FACTOR = 2.0
+STALL_ITERATIONS = 3
+
+
+@dataclass
+class DecompositionReport:
+    lower_bound: float
+    upper_bound: float
+    iterations: int
+    seconds: float
+
+    #(iteration, lower bound, upper bound) of every iteration
+    history: list = field(default_factory = list)
+
+    @property
+    def gap(self):
+        if self.upper_bound is None:
+            return None
+        return (self.upper_bound - self.lower_bound) / max(1e-10, abs(self.upper_bound))
+
+    def __str__(self):
+        gap = 'no feasible plan' if self.gap is None else 'gap %.4g%%' % (100 * self.gap)
+        return 'Decomposition bound %.6g, best plan %s (%s) after %d iterations in %.1f s' % (
+            self.lower_bound, self.upper_bound, gap, self.iterations, self.seconds)
+
+
+#Linear terms of the rows of the model that couple different periods, each as ({variable name: coefficient}, constant) with h(x) <= 0
+def linking_rows(model):
+    rows = []
+    for con in model.component_data_objects(pyo.Constraint, active = True):
+        if len(set(index_period(v.index()) for v in identify_variables(con.body))) < 2:
+            continue
+        repn = generate_standard_repn(con.body)
+        terms = {v.name: coef for v, coef in zip(repn.linear_vars, repn.linear_coefs)}
+        if con.upper is not None:
+            rows.append((terms, repn.constant - pyo.value(con.upper)))
+        if con.lower is not None:
+            rows.append(({name: -coef for name, coef in terms.items()}, pyo.value(con.lower) - repn.constant))
+    return rows
+
+
+#Terms of the objective of the model by period, {period: {variable name: coefficient}}
+def _objective_terms(model):
+    obj = next(model.component_data_objects(pyo.Objective, active = True))
+    repn = generate_standard_repn(obj.expr)
+    terms = {}
+    for v, coef in zip(repn.linear_vars, repn.linear_coefs):
+        terms.setdefault(index_period(v.index()), {})[v.name] = coef
+    return terms
+
+
+#Model of a worker, with the constraints grouped by period so that each subproblem only activates its own
+class _Subproblems:
+    def __init__(self, model_module, inputs):
+        import importlib
+        self.model = importlib.import_module(model_module).build_model(inputs)
+        self.variables = {v.name: v for v in self.model.component_data_objects(pyo.Var)}
+        self.objective = _objective_terms(self.model)
+        self.constraints = {}
+        for con in self.model.component_data_objects(pyo.Constraint, active = True):
+            periods = set(index_period(v.index()) for v in identify_variables(con.body))
+            if len(periods) == 1:
+                self.constraints.setdefault(periods.pop(), []).append(con)
+            con.deactivate()
+        for obj in self.model.component_data_objects(pyo.Objective, active = True):
+            obj.deactivate()
+
+    #Solve the subproblem of period i with the multiplier terms {variable name: coefficient}, returning its dual bound and solution
+    def solve(self, i, costs, time_limit, mip_gap):
+        from pyomo.contrib.appsi.solvers import Highs
+        opt = Highs()
+        opt.config.load_solution = False
+        if time_limit is not None:
+            opt.config.time_limit = time_limit
+        if mip_gap is not None:
+            opt.config.mip_gap = mip_gap
+
+        terms = dict(self.objective.get(i, {}))
+        for name, coef in costs.items():
+            terms[name] = terms.get(name, 0) + coef
+        for con in self.constraints.get(i, []):
+            con.activate()
+        self.model.subproblem_obj = pyo.Objective(expr = sum(coef * self.variables[name] for name, coef in terms.items()), sense = pyo.minimize)
+        try:
+            results = opt.solve(self.model)
+            if results.best_feasible_objective is None:
+                raise RuntimeError('The subproblem of period %d could not be solved (%s)' % (i, results.termination_condition.name))
+            results.solution_loader.load_vars()
+            values = {name: self.variables[name].value for name in terms}
+            values.update({v.name: v.value for con in self.constraints.get(i, []) for v in identify_variables(con.body)})
+            return results.best_objective_bound, values
+        finally:
+            self.model.del_component(self.model.subproblem_obj)
+            for con in self.constraints.get(i, []):
+                con.deactivate()
+
+
+_worker = {}
+
+
+def _init_worker(model_module, inputs):
+    _worker['subproblems'] = _Subproblems(model_module, inputs)
+
+
+def _solve_subproblem(i, costs, time_limit, mip_gap):
+    return _worker['subproblems'].solve(i, costs, time_limit, mip_gap)
+
+
+#Solve the model of model_module for the inputs by Lagrangian decomposition into one subproblem per period, solved by workers processes
+#time_limit and mip_gap apply to each subproblem, and a feasible plan is built from the period solutions every heuristic_every iterations
+#The DecompositionReport is returned with the model for the caller to print or log
+def lagrangian_decomposition(inputs, model_module = 'Optimal_Decarbonisation_Model_Python', workers = 1, max_iterations = 30, gap = 1e-3,
+                             time_limit = None, mip_gap = None, heuristic_every = 5):
+    import importlib
+    start = time.perf_counter()
+    model = importlib.import_module(model_module).build_model(inputs)
+    variables = {v.name: v for v in model.component_data_objects(pyo.Var)}
+    rows = linking_rows(model)
+    periods = list(model.periods)
+
+    if workers == 1:
+        _init_worker(model_module, inputs)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers = workers, initializer = _init_worker, initargs = (model_module, inputs))
+
+    mu = [0.0] * len(rows)
+    lower, upper, best = -float('inf'), None, None
+    factor, stall = STEP_FACTOR, 0
+    report = DecompositionReport(lower, upper, 0, 0.0)
+    try:
+        for iteration in range(1, max_iterations + 1):
+            costs = {i: {} for i in periods}
+            for m, (terms, _) in zip(mu, rows):
+                if m:
+                    for name, coef in terms.items():
+                        period_costs = costs[index_period(variables[name].index())]
+                        period_costs[name] = period_costs.get(name, 0) + m * coef
+
+            if pool is None:
+                solutions = [_solve_subproblem(i, costs[i], time_limit, mip_gap) for i in periods]
+            else:
+                futures = [pool.submit(_solve_subproblem, i, costs[i], time_limit, mip_gap) for i in periods]
+                solutions = [future.result() for future in futures]
+
+            bound = sum(b for b, _ in solutions) + sum(m * constant for m, (_, constant) in zip(mu, rows))
+            for _, values in solutions:
+                for name, value in values.items():
+                    variables[name].set_value(value, skip_validation = True)
+            if iteration == 1 or bound > lower + 1e-9 * max(1, abs(lower)):
+                lower, stall = bound, 0
+            else:
+                stall += 1
+                if stall >= STALL_ITERATIONS:
+                    factor, stall = factor / 2, 0
+
+            if iteration == 1 or iteration % heuristic_every == 0:
+                if repair_mip_start(model, time_limit = time_limit).status != 'failed':
+                    value = pyo.value(model.obj)
+                    if upper is None or value < upper:
+                        upper, best = value, model_solution(model)
+
+            report.history.append((iteration, lower, upper))
+            report.lower_bound, report.upper_bound, report.iterations = lower, upper, iteration
+            if upper is not None and report.gap <= gap:
+                break
+
+            #Subgradient step towards a larger bound, using the violation of the linking rows by the period solutions
+            violation = [sum(coef * variables[name].value for name, coef in terms.items()) + constant for terms, constant in rows]
+            norm = sum(h * h for h in violation)
+            if norm < 1e-12:
+                break
+            target = upper if upper is not None else abs(bound) + 1
+            step = factor * max(target - bound, 1e-6 * max(1, abs(target))) / norm
+            mu = [max(0.0, m + step * h) for m, h in zip(mu, violation)]
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    if best is not None:
+        for name, values in best.items():
+            var = model.component(name)
+            for index, value in values.items():
+                var[index].set_value(value, skip_validation = True)
+    report.seconds = time.perf_counter() - start
+    return model, report
@@ -0,0 +1,122 @@
+'''
+Created on 18th October 2026
+
+Persistent solver session for incremental what-if studies
+
+Re-running a what-if study used to rebuild multiperiod_energy_planning from
+scratch and hand the complete problem to the solver again. A PlanningSession
+builds the model once and keeps it loaded in a persistent Pyomo APPSI solver.
+Changing the emission limit, budget, fuel costs or any other data only
+updates the mutable parameters of the model (see Model_Template), and the
+solver receives just the affected coefficients and right-hand sides before
+re-solving from its existing instance.
+
+Only the parameters are checked for changes between solves, so the model
+structure must not be modified while a session is open.
+
+With warmstart, the current values of the variables, usually the incumbent
+of the previous solve, are passed to the solver as a MIP start.
+
+'''
+import pyomo.environ as pyo
+
+from Model_Template import update_model
+from Model_Presolve import presolve as presolve_model
+
+
+def _highs():
+    from pyomo.contrib.appsi.solvers import Highs
+    return Highs()
+
+
+def _gurobi():
+    from pyomo.contrib.appsi.solvers import Gurobi
+    return Gurobi()
+
+
+#Persistent solver interfaces, keyed by the same names as in Solver_Backends
+PERSISTENT_BACKENDS = {
+    'highs': _highs,
+    'gurobi': _gurobi,
+    }
+
+
+class PlanningSession:
+    def __init__(self, model, backend = 'highs', time_limit = None, mip_gap = None, threads = None, tee = False, presolve = True, warmstart = False):
+        if backend not in PERSISTENT_BACKENDS:
+            raise ValueError("Unknown persistent solver backend '%s', expected one of %s" % (backend, ', '.join(sorted(PERSISTENT_BACKENDS))))
+        self.model = model
+        self.backend = backend
+        self.warmstart = warmstart
+        self.opt = PERSISTENT_BACKENDS[backend]()
+        if not self.opt.available():
+            raise RuntimeError("Solver backend '%s' is not available on this machine" % backend)
+
+        self.opt.config.stream_solver = tee
+        self.opt.config.load_solution = False
+        if backend == 'highs':
+            self.opt.config.warmstart = warmstart
+        if time_limit is not None:
+            self.opt.config.time_limit = time_limit
+        if mip_gap is not None:
+            self.opt.config.mip_gap = mip_gap
+        if threads is not None:
+            if backend == 'highs':
+                self.opt.highs_options['threads'] = threads
+            else:
+                self.opt.gurobi_options['Threads'] = threads
+
+        #Only the parameters change between solves, so skip the costly scans for structural changes
+        update = self.opt.update_config
+        update.check_for_new_or_removed_constraints = False
+        update.check_for_new_or_removed_vars = False
+        update.check_for_new_or_removed_params = False
+        update.check_for_new_objective = False
+        update.update_constraints = False
+        update.update_vars = False
+        update.update_named_expressions = False
+        update.update_objective = False
+        update.update_params = True
+
+        #Rows that depend on mutable parameters are kept, so the presolve stays valid however the data is updated
+        self.presolve_report = presolve_model(model, keep_parameter_rows = True) if presolve else None
+
+        self.opt.set_instance(model)
+
+    #Emission limit of period i
+    def set_limit(self, i, value):
+        self._set(self.model.p_EP, self.model.EP, 'Limit', i, value)
+
+    #Budget of period i
+    def set_budget(self, i, value):
+        self._set(self.model.p_EP, self.model.EP, 'Budget', i, value)
+
+    #Cost of fuel in period i
+    def set_fuel_cost(self, fuel, i, value):
+        self._set(self.model.p_fuel, self.model.fuel, fuel, i, value)
+
+    #Overwrite all data with another scenario of the same structure
+    def update(self, inputs):
+        update_model(self.model, inputs)
+
+    #The data table is kept in step with the parameter so that results and reports stay consistent
+    #It is the copy held by the model (see Planning_Engine.build_model), never the table of the inputs
+    def _set(self, param, table, column, i, value):
+        param[i, column] = value
+        table[column][i] = value
+
+    #Re-solve the loaded model and load the solution into it if one was found
+    def solve(self):
+        #The Gurobi interface takes its MIP start from the Start attribute of the variables
+        if self.warmstart and self.backend == 'gurobi':
+            for v in self.model.component_data_objects(pyo.Var):
+                if v.value is not None and not v.fixed:
+                    #Variables that appear in no active row or objective are not loaded into the solver
+                    try:
+                        self.opt.set_var_attr(v, 'Start', v.value)
+                    except KeyError:
+                        pass
+        results = self.opt.solve(self.model)
+        if results.best_feasible_objective is not None:
+            results.solution_loader.load_vars()
+        return results
@@ -0,0 +1,582 @@
+'''
+Created on 18th October 2026
+
+Planning engine shared by the Base, Industry and Optimal Decarbonisation models
+
+The model scripts used to be near-copies of one formulation of
+multiperiod_energy_planning. The formulation is now built here once, and each
+script declares its variant as a ModelVariant of small plug-ins:
+
+    demand                  adds the demand rows, e.g. the regional energy
+                            demand of Cons_1, or the thermal and power
+                            demands of Cons_1 and Cons_A of the Industry model
+    demand_columns          EP columns that make up the total energy demand
+    plant_monotonicity      adds the rows that keep the deployment of the
+                            power plants from decreasing, e.g. Cons_6
+    technologies            further technologies with their own variables and
+                            constraints and their terms in the energy balance,
+                            the CO2 load and the cost, e.g. the purchased
+                            electricity of the Industry model
+    fuels                   fuel names whose cost data applies to a power plant
+    alternative_solid_fuels whether coal-based power plants may substitute
+                            alternative solid fuels
+
+and the layout of its results tables. Changes to the shared formulation, e.g.
+the sparse index sets, the mutable parameters or the big M values, therefore
+apply to every variant. The CCS options, alternative fuels, NETs and
+compensatory renewables are not part of a variant, but read from the input
+tables (see Technology_Catalogue).
+
+'''
+import copy
+from dataclasses import dataclass, field
+
+import pyomo.environ as pyo
+import numpy as np
+import pandas as pd
+from Solver_Backends import solve_with_backend
+from Model_Template import period_param, plant_param, structure_key
+from Model_Presolve import presolve as presolve_model, undo_presolve
+from Sparse_Index import operating_window, option_window, sparse
+from Big_M_Bounds import big_m_param, lp_bound_pass
+from Results_Arrays import plant_values, option_values, period_values, period_option_values, period_table
+from Technology_Catalogue import technology_catalogue, ccs_columns
+
+
+#A technology added by a variant: add(model, i) creates its variables and constraints, while supply, emission and cost
+#return its terms for period i in the energy balance (Cons_66), the CO2 load (Cons_67) and the total cost (Cons_69)
+#period_variables are read for the results tables, in which result_rows are available as rows:
+#(row, binary variable, deployment variable, CO2 intensity table, column)
+@dataclass
+class Technology:
+    name: str
+    add: object
+    supply: object
+    emission: object
+    cost: object
+    period_variables: tuple = ()
+    result_rows: tuple = ()
+
+
+#Power plant deployments may not decrease until the period before the decommissioning of the power plant
+def plant_decommissioning(model, i):
+    #If power plant s is decomissioned in a period, it should remain decommissioned at later periods
+    #However, power plant s should be available for power generation till the period before its decommissioning period
+    def energy_constraint(model, i, s):
+        if i <= model.plant[s]['OFF'] - 2:
+            return model.energy[i+1,s] >= model.energy[i,s]
+        else:
+            return pyo.Constraint.Skip
+        
+    model.Cons_6 = pyo.Constraint(model.W, rule = energy_constraint)
+
+
+#A single regional energy demand, met by all power plants
+def regional_demand(model, i):
+    #Prior to any energy planning, the total power generation from all power plants should satisfy the regional energy demand for period i
+    def demand(model, i):
+        return model.p_EP[i,'Demand'] == sum(sparse(model.energy, i, s) for s in model.S)
+        
+    model.Cons_1 = pyo.Constraint(i, rule = demand)
+
+
+@dataclass
+class ModelVariant:
+    name: str
+    demand: object = regional_demand
+    demand_columns: tuple = ('Demand',)
+
+    #Further deployment variables bounded by a big M, mapped to the EP column that bounds them (see Big_M_Bounds)
+    big_m_direct: dict = field(default_factory = dict)
+    plant_monotonicity: object = plant_decommissioning
+    technologies: tuple = ()
+    fuels: tuple = ('SOLAR', 'HYDRO', 'BIOGAS', 'BIOMASS', 'MSW', 'NG', 'OIL')
+    alternative_solid_fuels: bool = True
+
+    #Names of the rows of the NETs and compensatory energy in the results tables, in order, e.g. EP_NET_1 or SOLAR,
+    #or None for every NETs and compensatory energy option of the technology catalogues
+    result_rows: tuple = None
+
+    #Columns of the power plant results that are left out of the results tables
+    hidden_columns: tuple = ()
+
+
+#Build the model of the variant from a PlanningInputs object
+def build_model(inputs, variant):
+    model = pyo.ConcreteModel()
+    
+    #The model keeps its own copy of the data tables, so updating it, e.g. in a PlanningSession, never changes the inputs
+    model.plant = copy.deepcopy(inputs.plant)
+    model.EP = copy.deepcopy(inputs.EP)
+    model.fuel = copy.deepcopy(inputs.fuel)
+    model.REN_CI = copy.deepcopy(inputs.REN_CI)
+    model.REN_COST = copy.deepcopy(inputs.REN_COST)
+    model.CPX_1 = copy.deepcopy(inputs.CPX_1)
+    model.CPX_2 = copy.deepcopy(inputs.CPX_2)
+    model.SLD_CI = copy.deepcopy(inputs.SLD_CI)
+    model.SLD_COST = copy.deepcopy(inputs.SLD_COST)
+    model.GAS_CI = copy.deepcopy(inputs.GAS_CI)
+    model.GAS_COST = copy.deepcopy(inputs.GAS_COST)
+    model.CCS_data = copy.deepcopy(inputs.CCS_data)
+    model.NET_CI = copy.deepcopy(inputs.NET_CI)
+    model.NET_COST = copy.deepcopy(inputs.NET_COST)
+    model.TIME = copy.deepcopy(inputs.TIME)
+    
+    model.flag = inputs.flag
+    model.numperiods = inputs.numperiods
+    model.AFF = inputs.AFF
+    model.periods = inputs.periods
+    model.structure = structure_key(inputs)
+    model.variant = variant
+    
+    return multiperiod_energy_planning(model, model.periods, variant)
+
+
+def multiperiod_energy_planning(model, i, variant):
+    flag = model.flag
+    numperiods = model.numperiods
+    periods = model.periods
+    
+    model.S = model.plant.keys() 
+    
+    #TECHNOLOGY CATALOGUES
+    #The options of every technology class are read from the input tables, with one indexed variable and constraint family per class (see Technology_Catalogue)
+    catalogue = technology_catalogue(model)
+    model.CCS_OPTIONS = pyo.Set(initialize = catalogue.ccs)
+    model.SOLID_FUELS = pyo.Set(initialize = catalogue.solid)
+    model.GAS_FUELS = pyo.Set(initialize = catalogue.gas)
+    model.EP_NETS = pyo.Set(initialize = catalogue.ep_nets)
+    model.EC_NETS = pyo.Set(initialize = catalogue.ec_nets)
+    model.NETS = pyo.Set(initialize = catalogue.nets)
+    model.RENEWABLES = pyo.Set(initialize = catalogue.renewables)
+    CCS = {k: dict(zip(('RR', 'X', 'Cost', 'FX_Cost'), ccs_columns(k))) for k in catalogue.ccs}
+    
+    #LIST OF PARAMETERS
+    #All numeric data is held in mutable parameters, so that scenarios can overwrite it without rebuilding the model (see Model_Template)
+    model.p_plant = plant_param(model.plant)
+    model.p_EP = period_param(model.EP, i)
+    model.p_fuel = period_param(model.fuel, i)
+    model.p_REN_CI = period_param(model.REN_CI, i)
+    model.p_REN_COST = period_param(model.REN_COST, i)
+    model.p_CPX_1 = period_param(model.CPX_1, i)
+    model.p_CPX_2 = period_param(model.CPX_2, i)
+    model.p_SLD_CI = period_param(model.SLD_CI, i)
+    model.p_SLD_COST = period_param(model.SLD_COST, i)
+    model.p_GAS_CI = period_param(model.GAS_CI, i)
+    model.p_GAS_COST = period_param(model.GAS_COST, i)
+    model.p_CCS_data = period_param(model.CCS_data, i)
+    model.p_NET_CI = period_param(model.NET_CI, i)
+    model.p_NET_COST = period_param(model.NET_COST, i)
+    model.p_AFF = pyo.Param(initialize = model.AFF, mutable = True)
+    
+    #Big M of the NETs and compensatory energy deployments for period i, derived from the data (see Big_M_Bounds)
+    model.p_big_M = big_m_param(model, i, variant.demand_columns, variant.big_m_direct)
+    
+    #SPARSE INDEX SETS
+    #Power plant variables are only created for the (period, plant) pairs in which they can be non-zero (see Sparse_Index)
+    #The power plant classes follow the order of the fuel_substitution constraint
+    #CCS is deployed in all power plants that are not renewable, alternative solid fuels in coal-based and alternative gas fuels in natural gas-based power plants
+    #Variants without alternative solid fuels substitute them in no power plant
+    REN = [s for s in model.S if 'REN' in model.plant[s].values()]
+    NG = [s for s in model.S if s not in REN and 'NG' in model.plant[s].values()]
+    COAL = [s for s in model.S if s not in REN and s not in NG and 'COAL' in model.plant[s].values()] if variant.alternative_solid_fuels else []
+    FOSSIL = [s for s in model.S if s not in REN]
+    
+    window = operating_window(model.plant, periods)
+    model.W = pyo.Set(initialize = window, dimen = 2)
+    model.W_CCS = pyo.Set(initialize = option_window(window, FOSSIL, model.TIME, catalogue.ccs, periods), dimen = 3)
+    model.W_SOLID = pyo.Set(initialize = option_window(window, COAL, model.TIME, catalogue.solid, periods), dimen = 3)
+    model.W_GAS = pyo.Set(initialize = option_window(window, NG, model.TIME, catalogue.gas, periods), dimen = 3)
+    CCS_PAIRS = set((p, s) for (p, s, k) in model.W_CCS)
+          
+    #LIST OF VARIABLES
+    #This variable determines the deployment of energy sources in power plant s for period i
+    model.energy = pyo.Var(model.W, domain = pyo.NonNegativeReals)
+    
+    #This variable determines the CO2 intensity of energy sources in power plant s with CCS option k for period i
+    model.CI_RET = pyo.Var(model.W_CCS, domain = pyo.NonNegativeReals)
+    
+    #Binary variable for power generation by power plant s for period i
+    model.A = pyo.Var(model.W, domain = pyo.Binary)
+    
+    #Binary variable for the deployment of CCS option k in power plant s for period i
+    model.B = pyo.Var(model.W_CCS, domain = pyo.Binary)
+    
+    #Binary variable for the deployment of EP-NETs or EC-NETs option k for period i
+    model.D = pyo.Var(i, model.NETS, domain = pyo.Binary)
+    
+    #Binary variable for the deployment of compensatory renewable energy k for period i 
+    model.J = pyo.Var(i, model.RENEWABLES, domain = pyo.Binary)
+    
+    #Binary variable for the deployment of alternative solid-based fuel k in power plant s for period i 
+    model.O = pyo.Var(model.W_SOLID, domain = pyo.Binary)  
+    
+    #Binary variable for the deployment of alternative gas-based fuel k in power plant s for period i 
+    model.Q = pyo.Var(model.W_GAS, domain = pyo.Binary)  
+            
+    #This variable represents the deployment of CCS option k in power plant s for period i
+    model.CCS = pyo.Var(model.W_CCS, domain = pyo.NonNegativeReals) 
+    
+    #This variable determines the net energy available from power plant s without CCS deployment for period i
+    model.net_energy = pyo.Var(model.W, domain = pyo.NonNegativeReals)
+    
+    #This variable determines the net energy available from power plant s with the deployment of CCS option k for period i
+    model.net_energy_CCS = pyo.Var(model.W_CCS, domain = pyo.NonNegativeReals)
+    
+    #This variable represents the minimum deployment of EP-NETs or EC-NETs option k for period i
+    model.NET = pyo.Var(i, model.NETS, domain = pyo.NonNegativeReals)
+    
+    #This variable determines the minimum deployment of compensatory renewable energy k for period i
+    model.REN = pyo.Var(i, model.RENEWABLES, domain = pyo.NonNegativeReals)
+    
+    #This variable determines the minimum deployment of alternative solid-based fuel k for coal-based plant s for period i
+    model.solid = pyo.Var(model.W_SOLID, domain = pyo.NonNegativeReals)
+    
+    #This variable determines the minimum deployment of alternative gas-based fuel k for natural gas-based plant s for period i
+    model.gas = pyo.Var(model.W_GAS, domain = pyo.NonNegativeReals)
+
+    #This variable determines the revised total CO2 emissions for period i
+    model.new_emission = pyo.Var(i, domain = pyo.NonNegativeReals)
+
+    #This variable determines the total energy cost of power plant s for period i
+    model.energy_cost = pyo.Var(model.W, domain = pyo.NonNegativeReals, initialize = 0)
+
+    #This variable determines the total energy planning cost for period i
+    model.sum_cost = pyo.Var(i, domain = pyo.NonNegativeReals)    
+    
+    #Variables and constraints of the technologies of the variant, e.g. the purchased electricity of the Industry model
+    for technology in variant.technologies:
+        technology.add(model, i)
+    
+    
+    #OBJECTIVE FUNCTION
+    
+    #For the minimum budget objective function, the total cost is minimised, subject to the satisfaction of the CO2 emission limit
+    #For the minimum emission objective function, the total emission is minimised, subject to the available budgetary constraint
+    if flag == 'min_budget':
+        model.obj = pyo.Objective(expr = sum(model.sum_cost[i] for i in periods), sense = pyo.minimize)
+    else:
+        model.obj = pyo.Objective(expr = sum(model.new_emission[i] for i in periods), sense = pyo.minimize)
+   
+    #CONSTRAINTS
+    #The constraints of a technology class cover all of its options, and keep the number of the constraint of its first option,
+    #e.g. Cons_7 holds the CO2 intensity of every CCS option
+    
+    
+    #Prior to any energy planning, the total power generation should satisfy the demand for period i, as structured by the variant
+    variant.demand(model, i)
+    
+
+	#The deployment of energy source in power plant s should at least satisfy the lower bound for period i
+    def lower_bound_energy(model, i, s):
+        return model.energy[i,s] >= model.p_plant[s,'LB'] * model.A[i,s]
+        
+    model.Cons_2 = pyo.Constraint(model.W, rule = lower_bound_energy)
+    
+    
+    #The deployment of energy source in power plant s should at most satisfy the upper bound for period i
+    def upper_bound_energy(model, i, s):
+        return model.energy[i,s] <= model.p_plant[s,'UB'] * model.A[i,s]
+        
+    model.Cons_3 = pyo.Constraint(model.W, rule = upper_bound_energy)
+    
+
+    #There should not be power generation from power plant s before its commissioning period and after its decommissioning period
+    #energy is only created within the operating window model.W of power plant s, so no constraints are needed
+    
+
+    #The deployment of the power plants may not decrease from one period to the next, as far as the variant requires it
+    variant.plant_monotonicity(model, i)
+    
+    
+    #Calculation of carbon intensity of energy sources with CCS option k in power plant s for period i
+    def CCS_CI(model, i, s, k):
+        return model.p_plant[s,'CI'] * (1 - model.p_CCS_data[i,CCS[k]['RR']]) / (1 - model.p_CCS_data[i,CCS[k]['X']]) == model.CI_RET[i,s,k]
+    
+    model.Cons_7 = pyo.Constraint(model.W_CCS, rule = CCS_CI)
+    
+    
+    #If selected, the deployment of CCS option k in power plant s is limited by the upper bound of the energy output for period i     
+    def CCS_limit(model, i, s, k):
+        return model.CCS[i,s,k] <= model.p_plant[s,'UB'] * model.B[i,s,k]
+        
+    model.Cons_9 = pyo.Constraint(model.W_CCS, rule = CCS_limit)
+    
+       
+    #The total CCS deployment in power plant s should be equal to summation of deployment of individual types of  CCS technology for period i
+    def CCS_total(model, i, s):
+        if (i,s) not in CCS_PAIRS:
+            return pyo.Constraint.Skip
+        else:
+            return sum(sparse(model.CCS, i, s, k) for k in model.CCS_OPTIONS) <= model.energy[i,s]
+        
+    model.Cons_11 = pyo.Constraint(model.W, rule = CCS_total)
+    
+    
+    #The deployment of CCS option k at later periods should at least match the deployment in the previous period
+    def CCS_constraint(model, i, s, k):
+        if i == numperiods - 1:
+            return pyo.Constraint.Skip
+        else:
+            return model.CCS[i+1,s,k] >= model.CCS[i,s,k]
+        
+    model.Cons_12 = pyo.Constraint(model.W_CCS, rule = CCS_constraint)
+    
+    
+    #Determine the net energy available from power plant s with CCS option k for period i
+    def CCS_net_energy(model, i, s, k):
+       return model.CCS[i,s,k] * (1 - model.p_CCS_data[i,CCS[k]['X']]) == model.net_energy_CCS[i,s,k]
+        
+    model.Cons_14 = pyo.Constraint(model.W_CCS, rule = CCS_net_energy)
+        
+        
+    #The deployment of alternative solid fuel k at later periods should at least match the deployment in the previous period
+    def alt_solid_constraint(model, i, s, k):
+        if i == numperiods - 1:
+            return pyo.Constraint.Skip
+        else:
+            return model.solid[i+1,s,k] >= model.solid[i,s,k]
+        
+    model.Cons_16 = pyo.Constraint(model.W_SOLID, rule = alt_solid_constraint)
+    
+    
+    #The deployment of alternative gas fuel k at later periods should at least match the deployment in the previous period
+    def alt_gas_constraint(model, i, s, k):
+        if i == numperiods - 1:
+            return pyo.Constraint.Skip
+        else:
+            return model.gas[i+1,s,k] >= model.gas[i,s,k]
+        
+    model.Cons_18 = pyo.Constraint(model.W_GAS, rule = alt_gas_constraint)
+    
+    
+    #The total energy contribution must equal the initially determined energy contribution of power plant s for period i
+    #The CCS and alternative fuel variables only exist for the power plants that can deploy them, see SPARSE INDEX SETS
+    def fuel_substitution(model, i, s):
+        return (model.net_energy[i,s] + sum(sparse(model.CCS, i, s, k) for k in model.CCS_OPTIONS) + sum(sparse(model.solid, i, s, k) for k in model.SOLID_FUELS)
+        + sum(sparse(model.gas, i, s, k) for k in model.GAS_FUELS) == model.energy[i,s])
+        
+    model.Cons_20 = pyo.Constraint(model.W, rule = fuel_substitution)  
+    
+    
+    #The CCS options would not be deployed in power plants fuelled by renewable energy sources, nor before their technology implementation time
+    #CCS and B are only created for the other power plants from the implementation periods onwards, so no constraints are needed
+        
+    
+    #Technology implementation time for the EP-NETs and EC-NETs
+    def deployment_NETs(model, i, k):
+        if model.TIME[k][i] == 'NO':
+            return model.D[i,k] == 0
+        else:
+            return pyo.Constraint.Skip
+        
+    model.Cons_25 = pyo.Constraint(i, model.NETS, rule = deployment_NETs)   
+    
+    
+    #Technology implementation time for the compensatory renewable energy
+    def deployment_renewables(model, i, k):
+        if model.TIME[k][i] == 'NO':
+            return model.J[i,k] == 0
+        else:
+            return pyo.Constraint.Skip
+        
+    model.Cons_31 = pyo.Constraint(i, model.RENEWABLES, rule = deployment_renewables)
+    
+    
+    #Technology implementation time for the alternative solid and gas fuels
+    #O and Q are only created from the implementation periods onwards, so no constraints are needed
+    
+    
+    #Big M formulation for the deployment of EP-NETs and EC-NETs option k for period i
+    def big_M_NETs(model, i, k):
+        return model.NET[i,k] <= model.D[i,k] * model.p_big_M[k, i]
+    
+    model.Cons_40 = pyo.Constraint(i, model.NETS, rule = big_M_NETs) 
+    
+    
+    #Big M formulation for the deployment of compensatory renewable energy k for period i
+    def big_M_renewables(model, i, k):
+        return model.REN[i,k] <= model.J[i,k] * model.p_big_M[k, i]
+    
+    model.Cons_46 = pyo.Constraint(i, model.RENEWABLES, rule = big_M_renewables) 
+    
+    
+    #Big M formulation for deployment of alternative solid fuel k for period i
+    def big_M_alt_solid(model, i, s, k):
+        return model.solid[i,s,k] <= model.O[i,s,k] * model.p_plant[s,'UB']
+    
+    model.Cons_51 = pyo.Constraint(model.W_SOLID, rule = big_M_alt_solid)
+    
+    
+    #Big M formulation for deployment of alternative gas fuel k for period i
+    def big_M_alt_gas(model, i, s, k):
+        return model.gas[i,s,k] <= model.Q[i,s,k] * model.p_plant[s,'UB']
+    
+    model.Cons_53 = pyo.Constraint(model.W_GAS, rule = big_M_alt_gas)
+
+    
+    #The deployment of compensatory renewable energy k at later periods should at least match the deployment in the previous period
+    def renewables_time_constraint(model, i, k):
+        if i == numperiods - 1:
+            return pyo.Constraint.Skip
+        else:
+            return model.REN[i+1,k] >= model.REN[i,k]
+        
+    model.Cons_55 = pyo.Constraint(i, model.RENEWABLES, rule = renewables_time_constraint)
+    
+    
+    #The deployment of EP-NETs and EC-NETs option k at later periods should at least match the deployment in the previous period
+    def NETs_time_constraint(model, i, k):
+        if i == numperiods - 1:
+            return pyo.Constraint.Skip
+        else:
+            return model.NET[i+1,k] >= model.NET[i,k]
+        
+    model.Cons_60 = pyo.Constraint(i, model.NETS, rule = NETs_time_constraint)
+    
+    
+    #Total energy contribution from all energy sources to satisfy the total demand for period i
+    #EP-NETs produce and EC-NETs consume energy
+    def total_energy(model, i):
+        return (sum(sparse(model.net_energy, i, s) + sum(sparse(model.net_energy_CCS, i, s, k) for k in model.CCS_OPTIONS) + sum(sparse(model.solid, i, s, k) for k in model.SOLID_FUELS)
+        + sum(sparse(model.gas, i, s, k) for k in model.GAS_FUELS) for s in model.S)
+        + sum(model.REN[i,k] for k in model.RENEWABLES) + sum(model.NET[i,k] for k in model.EP_NETS) + sum(technology.supply(model, i) for technology in variant.technologies)
+        == sum(model.p_EP[i,c] for c in variant.demand_columns) + sum(model.NET[i,k] for k in model.EC_NETS))
+        
+    model.Cons_66 = pyo.Constraint(i, rule = total_energy)
+    
+    
+    #The total CO2 load contribution from all energy sources must satisfy most the CO2 emission limit in period i
+    def total_CO2_load(model, i):
+        return (sum((sparse(model.net_energy, i, s) * model.p_plant[s,'CI'])
+        + sum(sparse(model.net_energy_CCS, i, s, k) * model.p_plant[s,'CI'] * (1 - model.p_CCS_data[i,CCS[k]['RR']]) / (1 - model.p_CCS_data[i,CCS[k]['X']]) for k in model.CCS_OPTIONS)
+        + sum(sparse(model.solid, i, s, k) * model.p_SLD_CI[i,k] for k in model.SOLID_FUELS)
+        + sum(sparse(model.gas, i, s, k) * model.p_GAS_CI[i,k] for k in model.GAS_FUELS) for s in model.S) 
+        + sum(model.NET[i,k] * model.p_NET_CI[i,k] for k in model.NETS)
+        + sum(model.REN[i,k] * model.p_REN_CI[i,k] for k in model.RENEWABLES)
+        + sum(technology.emission(model, i) for technology in variant.technologies) == model.new_emission[i])
+
+    model.Cons_67 = pyo.Constraint(i, rule = total_CO2_load)
+       
+    
+    #Determining the cumulative total fuel and annualised capital cost for all power plants for period i
+    #The cost data of power plant s is that of the first of the fuels of the variant in its plant data, or of COAL otherwise
+    def energy_cost(model, i, s):
+        fuel = next((f for f in variant.fuels if f in model.plant[s].values()), 'COAL')
+        return model.energy_cost[i,s] == (model.net_energy[i,s] * model.p_fuel[i,fuel]) + (model.p_AFF * model.p_CPX_1[i,fuel] * model.A[i,s]) + (model.p_AFF * model.energy[i,s] * model.p_CPX_2[i,fuel])
+    
+    model.Cons_68 = pyo.Constraint(model.W, rule = energy_cost)        
+    
+    
+    #The summation of cost for each power plant s should equal to the total cost of each period i
+    #The annualised capital cost of the alternative solid and gas fuels is that of BIOMASS and BIOGAS respectively
+    def sum_cost(model, i):
+        return (sum(sum((sparse(model.net_energy_CCS, i, s, k) * model.p_CCS_data[i,CCS[k]['Cost']]) + (model.p_AFF * model.p_CCS_data[i,CCS[k]['FX_Cost']] * sparse(model.B, i, s, k)) for k in model.CCS_OPTIONS)
+        + sum((sparse(model.solid, i, s, k) * model.p_SLD_COST[i,k]) + (model.p_AFF * model.p_CPX_1[i,'BIOMASS'] * sparse(model.O, i, s, k)) for k in model.SOLID_FUELS)
+        + sum((sparse(model.gas, i, s, k) * model.p_GAS_COST[i,k]) + (model.p_AFF * model.p_CPX_1[i,'BIOGAS'] * sparse(model.Q, i, s, k)) for k in model.GAS_FUELS) for s in model.S)
+        + sum((model.NET[i,k] * model.p_NET_COST[i,k]) + (model.p_AFF * model.p_CPX_1[i,k] * model.D[i,k]) + (model.p_AFF * model.NET[i,k] * model.p_CPX_2[i,k]) for k in model.NETS)
+        + sum((model.REN[i,k] * model.p_REN_COST[i,k]) + (model.p_AFF * model.p_CPX_1[i,k] * model.J[i,k]) + (model.p_AFF * model.REN[i,k] * model.p_CPX_2[i,k]) for k in model.RENEWABLES)
+        + sum(technology.cost(model, i) for technology in variant.technologies) + sum(sparse(model.energy_cost, i, s) for s in model.S) == model.sum_cost[i])
+        
+    model.Cons_69 = pyo.Constraint(i, rule = sum_cost)
+    
+    
+    #For the minimum budget objective function, the total cost is minimised, subject to the satisfaction of the CO2 emission limit
+    #For the minimum emission objective function, the total emission is minimised, subject to the available budgetary constraint
+    def objective_constraint(model, i):
+        if flag == 'min_budget':
+            return model.new_emission[i] <= model.p_EP[i,'Limit']
+        else:
+            return model.sum_cost[i] <= model.p_EP[i,'Budget']
+    
+    model.Cons_70 = pyo.Constraint(i, rule = objective_constraint)
+    
+    
+    return model
+
+
+#Solve the energy planning model with one of the backends registered in Solver_Backends, e.g. 'gams', 'highs', 'cbc' or 'glpk'
+#The presolve fixes the variables that the data forces to a value before the model is handed to the solver, and is undone afterwards
+#With lp_bounds, the big M values are first tightened over the LP relaxation (see Big_M_Bounds)
+#With warmstart, the current variable values, e.g. set by MIP_Start, are passed to the solver as a MIP start
+def solve(model, backend = None, time_limit = None, mip_gap = None, threads = None, tee = False, presolve = True, lp_bounds = False, warmstart = False):
+    if lp_bounds:
+        print('LP bound pass tightened %d big M values' % lp_bound_pass(model))
+    if presolve:
+        print(presolve_model(model))
+    try:
+        results = solve_with_backend(model, backend, time_limit, mip_gap, threads, tee, warmstart)
+    finally:
+        if presolve:
+            undo_presolve(model)
+    
+    #Only the outcome is reported, the variable values are loaded into the model
+    print('Termination condition: %s, objective: %s' % (results.solver.termination_condition, pyo.value(model.obj, exception = False)))
+    #model.pprint()   
+    return results
+
+
+#Collect the results table of every period of a solved model, laid out as declared by its variant
+#The variable values are read once into arrays indexed by (period, plant) or (period, plant, option), from which the tables of all periods are assembled
+def extract_results(model):
+    variant = model.variant
+    periods = model.periods
+    plants = list(model.plant.keys())
+    CCS, SOLID, GAS, NETS, RENEWABLES = (list(model.CCS_OPTIONS), list(model.SOLID_FUELS), list(model.GAS_FUELS), list(model.NETS), list(model.RENEWABLES))
+    x = plant_values(model, ['A', 'energy', 'net_energy'], periods, plants)
+    x.update(option_values(model, ['B', 'CCS', 'CI_RET', 'net_energy_CCS'], periods, plants, CCS))
+    x.update(option_values(model, ['O', 'solid'], periods, plants, SOLID))
+    x.update(option_values(model, ['Q', 'gas'], periods, plants, GAS))
+    y = period_values(model, [v for technology in variant.technologies for v in technology.period_variables] + ['new_emission', 'sum_cost'], periods)
+    y.update(period_option_values(model, ['D', 'NET'], periods, NETS))
+    y.update(period_option_values(model, ['J', 'REN'], periods, RENEWABLES))
+    fuel = [model.plant[s]['Fuel'] for s in plants]
+    CI = np.array([model.plant[s]['CI'] for s in plants], dtype = float)
+    
+    net_energy = x['net_energy'] + x['net_energy_CCS'].sum(axis = 2) + x['solid'].sum(axis = 2) + x['gas'].sum(axis = 2)
+    CO2_load = ((x['net_energy'] * CI) + (x['net_energy_CCS'] * x['CI_RET']).sum(axis = 2) 
+    + (x['solid'] * period_table(model.SLD_CI, SOLID, periods)[:,None,:]).sum(axis = 2) 
+    + (x['gas'] * period_table(model.GAS_CI, GAS, periods)[:,None,:]).sum(axis = 2))
+    
+    #Rows of the NETs, compensatory energy and technologies of the variant: (row, selection values, deployment values, CO2 intensity)
+    catalogue = ([(k.replace('NETs', 'NET'), y['D'][:,n], y['NET'][:,n], model.NET_CI[k]) for n, k in enumerate(NETS)]
+                 + [(k, y['J'][:,n], y['REN'][:,n], model.REN_CI[k]) for n, k in enumerate(RENEWABLES)])
+    available = {row[0]: row for row in catalogue}
+    for technology in variant.technologies:
+        available.update({row: (row, y[binary], y[var], getattr(model, table)[column]) for row, binary, var, table, column in technology.result_rows})
+    rows = [available[row] for row in (variant.result_rows or [row for row, _, _, _ in catalogue])]
+    
+    results = {}
+    for n, i in enumerate(periods):
+        columns = {
+            'Fuel': fuel,
+            'Energy Generation': x['A'][n],
+            'Gross Energy (TWh/y)': np.round(x['energy'][n], 2),
+            'CO2 Intensity (Mt/TWh)': CI}
+        for m, k in enumerate(CCS):
+            columns['%s Selection' % k] = x['B'][n,:,m]
+            columns['%s Ret (TWh/y)' % k] = np.round(x['CCS'][n,:,m], 2)
+        for m, k in enumerate(SOLID):
+            columns['%s Selection' % k.capitalize()] = x['O'][n,:,m]
+            columns['%s (TWh/y)' % k] = np.round(x['solid'][n,:,m], 2)
+        for m, k in enumerate(GAS):
+            columns['%s Selection' % k.capitalize()] = x['Q'][n,:,m]
+            columns['%s (TWh/y)' % k] = np.round(x['gas'][n,:,m], 2)
+        columns['Net Energy (TWh/y)'] = np.round(net_energy[n], 2)
+        columns['CO2 Load (Mt/y)'] = np.round(CO2_load[n], 2)
+        energy_planning = pd.DataFrame({c: values for c, values in columns.items() if c not in variant.hidden_columns}, index = plants)
+        
+        technologies = pd.DataFrame({
+            'Fuel': [row for row, _, _, _ in rows],
+            'Energy Generation': [selection[n] for _, selection, _, _ in rows],
+            'CO2 Intensity (Mt/TWh)': [CI_column[i] for _, _, _, CI_column in rows],
+            'Net Energy (TWh/y)': [round(deployment[n], 2) for _, _, deployment, _ in rows],
+            'CO2 Load (Mt/y)': [round(deployment[n] * CI_column[i], 2) for _, _, deployment, CI_column in rows]}, index = [row for row, _, _, _ in rows])
+        
+        total = pd.DataFrame({
+            'CO2 Load (Mt/y)': [round(y['new_emission'][n], 2)],
+            'Total Cost (mil USD/y)': [round(y['sum_cost'][n], 2)]}, index = ['TOTAL'])
+        
+        results[i] = pd.concat([energy_planning, technologies, total])
+            
+    return results
@@ -0,0 +1,77 @@
+'''
+Created on 18th October 2026
+
+Bulk extraction of solved variable values into NumPy arrays
+
+The results tables used to be grown one cell at a time, calling a Pyomo
+variable for every (period, plant) value. The helpers below read the values
+of a whole variable in one pass over its index instead, so the results tables
+of all periods can be assembled from arrays indexed by (period, plant), or
+by (period, plant, option) for the options of the technology catalogues.
+
+'''
+import numpy as np
+
+
+#Values of the variables indexed by (period, plant), as arrays of shape (number of periods, number of plants)
+#Pairs for which a variable was not created (see Sparse_Index) are 0, and variables without a value are NaN
+def plant_values(model, names, periods, plants):
+    row = {i: n for n, i in enumerate(periods)}
+    col = {s: n for n, s in enumerate(plants)}
+    positions = {}
+    values = {}
+    for name in names:
+        var = getattr(model, name)
+        array = np.zeros((len(periods), len(plants)))
+        if len(var):
+            #Variables created over the same sparse index set share their positions
+            key = id(var.index_set())
+            if key not in positions:
+                positions[key] = (np.array([row[i] for (i, s) in var.keys()]), np.array([col[s] for (i, s) in var.keys()]))
+            rows, cols = positions[key]
+            array[rows, cols] = np.fromiter((np.nan if v.value is None else v.value for v in var.values()), float, len(var))
+        values[name] = array
+    return values
+
+
+#Values of the variables indexed by (period, plant, option) of a technology catalogue (see Technology_Catalogue),
+#as arrays of shape (number of periods, number of plants, number of options)
+def option_values(model, names, periods, plants, options):
+    row = {i: n for n, i in enumerate(periods)}
+    col = {s: n for n, s in enumerate(plants)}
+    layer = {k: n for n, k in enumerate(options)}
+    positions = {}
+    values = {}
+    for name in names:
+        var = getattr(model, name)
+        array = np.zeros((len(periods), len(plants), len(options)))
+        if len(var):
+            key = id(var.index_set())
+            if key not in positions:
+                positions[key] = tuple(np.array(a) for a in zip(*[(row[i], col[s], layer[k]) for (i, s, k) in var.keys()]))
+            array[positions[key]] = np.fromiter((np.nan if v.value is None else v.value for v in var.values()), float, len(var))
+        values[name] = array
+    return values
+
+
+#Values of the variables indexed by period, as arrays of shape (number of periods,)
+def period_values(model, names, periods):
+    values = {}
+    for name in names:
+        var = getattr(model, name)
+        values[name] = np.array([var[i].value for i in periods], dtype = float)
+    return values
+
+
+#Values of the variables indexed by (period, option), as arrays of shape (number of periods, number of options)
+def period_option_values(model, names, periods, options):
+    values = {}
+    for name in names:
+        var = getattr(model, name)
+        values[name] = np.array([[var[i,k].value for k in options] for i in periods], dtype = float).reshape(len(periods), len(options))
+    return values
+
+
+#Columns of a period data table, e.g. model.SLD_CI, as an array of shape (number of periods, number of columns)
+def period_table(table, columns, periods):
+    return np.array([[table[c][i] for c in columns] for i in periods], dtype = float).reshape(len(periods), len(columns))
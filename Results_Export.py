@@ -0,0 +1,52 @@
+'''
+Created on 18th October 2026
+
+Excel export of the results tables
+
+The results of each period used to be appended to the user interface
+workbook by a separate ExcelWriter, which reloaded and rewrote the whole
+workbook once per period and named every sheet Results_Period_1. The
+exporter below writes the tables of every period, and optionally of several
+scenarios, with a single load and save of the workbook, one correctly named
+sheet per period.
+
+'''
+import os
+
+import pandas as pd
+
+
+#Excel limits sheet names to 31 characters, which may not contain any of these
+SHEET_NAME_LENGTH = 31
+INVALID_SHEET_CHARACTERS = '[]:*?/\\'
+
+
+#Sheet name of the results of period i, prefixed by the scenario name if there is one
+def sheet_name(i, scenario = None):
+    suffix = 'Results_Period_%s' % i
+    if scenario is None:
+        return suffix[:SHEET_NAME_LENGTH]
+    prefix = ''.join('_' if c in INVALID_SHEET_CHARACTERS else c for c in str(scenario))
+    return prefix[:SHEET_NAME_LENGTH - len(suffix) - 1] + '_' + suffix
+
+
+#Write the results tables to the workbook at path with a single save
+#results is either {period: DataFrame} for one run or {scenario: {period: DataFrame}} for several scenarios
+#With append, the sheets are added to an existing workbook such as the user interface, replacing results sheets of the same name
+#Otherwise a new workbook holding only the results is written
+def export_results(results, path, append = True):
+    if results and all(isinstance(tables, dict) for tables in results.values()):
+        sheets = [(sheet_name(i, scenario), table) for scenario, tables in results.items() for i, table in tables.items()]
+    else:
+        sheets = [(sheet_name(i), table) for i, table in results.items()]
+    names = [name for name, _ in sheets]
+    if len(set(names)) != len(names):
+        raise ValueError('The scenario names do not give unique sheet names within the %d character limit of Excel' % SHEET_NAME_LENGTH)
+
+    if append and os.path.exists(path):
+        writer = pd.ExcelWriter(path, engine = 'openpyxl', mode = 'a', if_sheet_exists = 'replace')
+    else:
+        writer = pd.ExcelWriter(path, engine = 'openpyxl', mode = 'w')
+    with writer:
+        for name, table in sheets:
+            table.to_excel(writer, sheet_name = name)
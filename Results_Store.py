@@ -0,0 +1,126 @@
+'''
+Created on 18th October 2026
+
+Columnar results store for large numbers of runs
+
+Loading thousands of xlsx results sheets is slow, so this module stores the
+results of every solve as a tidy table with the columns
+
+    scenario, period, plant, technology, variable, value
+
+in a dataset of Parquet (or Arrow IPC) files partitioned by scenario, e.g.
+results/scenario=high_fuel_price/part-0.parquet. A ResultsStore writes the
+results of each model as soon as it is solved, and load_results reads any
+selection of scenarios back into a single DataFrame.
+
+Variables that are not indexed by plant, such as the NETs deployments, have
+an empty plant. The technology of the CCS options, alternative fuels, NETs and
+compensatory renewables is their option in the technology catalogue, e.g.
+CCS_1, GAS_2, EP_NETs_1 or SOLAR (see Technology_Catalogue). Re-storing a scenario replaces its earlier results.
+
+The store needs the pyarrow package, which is only imported when it is used.
+
+'''
+import numpy as np
+import pandas as pd
+
+
+#Variables indexed by (period, plant): (technology, variable)
+PLANT_VARIABLES = {
+    'A': ('PLANT', 'selection'),
+    'energy': ('PLANT', 'gross_energy'),
+    'net_energy': ('PLANT', 'net_energy'),
+    'energy_cost': ('PLANT', 'cost'),
+    }
+
+#Variables indexed by (period, plant, option) of the technology catalogues, whose technology is the option, e.g. CCS_1: variable
+OPTION_VARIABLES = {
+    'B': 'selection',
+    'CCS': 'retrofit',
+    'net_energy_CCS': 'net_energy',
+    'CI_RET': 'CI',
+    'O': 'selection',
+    'solid': 'energy',
+    'Q': 'selection',
+    'gas': 'energy',
+    }
+
+#Variables indexed by period: (technology, variable)
+PERIOD_VARIABLES = {
+    'T': ('ELECTRICITY', 'selection'),
+    'electricity': ('ELECTRICITY', 'energy'),
+    'new_emission': ('TOTAL', 'emission'),
+    'sum_cost': ('TOTAL', 'cost'),
+    }
+
+#Variables indexed by (period, option) of the technology catalogues, whose technology is the option, e.g. EP_NETs_1 or SOLAR: variable
+PERIOD_OPTION_VARIABLES = {
+    'D': 'selection',
+    'NET': 'energy',
+    'J': 'selection',
+    'REN': 'energy',
+    }
+
+#Supported file formats, by the name used in pyarrow.dataset
+FORMATS = ('parquet', 'arrow')
+
+
+#Tidy table of the values of every variable of a solved model, skipping the variables a model variant does not have
+def tidy_results(model, scenario = 'base'):
+    columns = {'period': [], 'plant': [], 'technology': [], 'variable': [], 'value': []}
+    families = ([(name, technology, variable, True) for name, (technology, variable) in PLANT_VARIABLES.items()]
+                + [(name, None, variable, True) for name, variable in OPTION_VARIABLES.items()]
+                + [(name, technology, variable, False) for name, (technology, variable) in PERIOD_VARIABLES.items()]
+                + [(name, None, variable, False) for name, variable in PERIOD_OPTION_VARIABLES.items()])
+    for name, technology, variable, by_plant in families:
+        var = getattr(model, name, None)
+        if var is None or not len(var):
+            continue
+        keys = list(var.keys())
+        columns['period'].append(np.array([k[0] if isinstance(k, tuple) else k for k in keys], dtype = np.int64))
+        columns['plant'].append(np.array([k[1] if by_plant else '' for k in keys], dtype = object))
+        if technology is None:
+            columns['technology'].append(np.array([k[-1] for k in keys], dtype = object))
+        else:
+            columns['technology'].append(np.full(len(keys), technology, dtype = object))
+        columns['variable'].append(np.full(len(keys), variable, dtype = object))
+        columns['value'].append(np.fromiter((np.nan if v.value is None else v.value for v in var.values()), float, len(keys)))
+
+    table = pd.DataFrame({c: np.concatenate(arrays) for c, arrays in columns.items()})
+    table.insert(0, 'scenario', str(scenario))
+    return table
+
+
+def _check_format(file_format):
+    if file_format not in FORMATS:
+        raise ValueError("Unknown results format '%s', expected one of %s" % (file_format, ', '.join(FORMATS)))
+
+
+#Dataset of tidy results under root, partitioned by scenario
+class ResultsStore:
+    def __init__(self, root, file_format = 'parquet'):
+        _check_format(file_format)
+        self.root = root
+        self.file_format = file_format
+
+    #Write the results of a solved model, replacing any earlier results of the same scenario
+    def add(self, model, scenario = 'base'):
+        self.add_table(tidy_results(model, scenario))
+
+    def add_table(self, table):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        ds.write_dataset(pa.Table.from_pandas(table, preserve_index = False), self.root, format = self.file_format,
+                         partitioning = ['scenario'], partitioning_flavor = 'hive', existing_data_behavior = 'delete_matching')
+
+    def load(self, scenarios = None):
+        return load_results(self.root, scenarios, self.file_format)
+
+
+#Read the tidy results of the given scenarios, or of all scenarios, into a single DataFrame
+def load_results(root, scenarios = None, file_format = 'parquet'):
+    _check_format(file_format)
+    import pyarrow.dataset as ds
+    dataset = ds.dataset(root, format = file_format, partitioning = 'hive')
+    expression = None if scenarios is None else ds.field('scenario').isin([str(s) for s in scenarios])
+    return dataset.to_table(filter = expression).to_pandas()
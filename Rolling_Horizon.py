@@ -0,0 +1,112 @@
+'''
+Created on 18th October 2026
+
+Rolling-horizon solve mode for long planning horizons
+
+The multiperiod MILP grows badly with the number of periods. The rolling
+horizon solves a window of the first k periods only, fixes the decisions of
+the first few periods of the window and slides the window forward by that
+many periods, until the window reaches the last period.
+
+The window is cut out of the complete model: the constraints of the periods
+after the window are deactivated, which leaves the variables of those periods
+free, so their cost and emission are minimised to 0 and do not affect the
+objective of the window. The decisions of earlier windows are fixed
+variables, so the constraints that carry the monotonicity of the deployments
+from one period to the next (energy_constraint, CCS_constraint,
+alt_solid_constraint, the time constraints of the renewables and NETs, ...)
+only have one free variable left at the start of the window, which the
+presolve turns into a bound of that variable.
+
+The deployments of a window are chosen without knowing the later periods, so
+a deployment that may not decrease can make a later window infeasible, e.g.
+when the demand falls. Such a window is solved again with only the selections
+of the earlier periods fixed, which frees their deployments and energy to be
+re-planned. A window that is infeasible even then ends the solve with an error.
+
+The result is a feasible but in general not optimal plan, found in time that
+grows roughly linearly with the number of periods.
+
+'''
+import time
+from dataclasses import dataclass
+
+import pyomo.environ as pyo
+from pyomo.common.collections import ComponentSet
+
+
+@dataclass
+class WindowReport:
+    first_period: int
+    last_period: int
+
+    #Periods whose decisions were fixed after solving the window
+    committed: list
+    termination_condition: str
+    seconds: float
+
+    #Whether the continuous decisions of the earlier periods had to be released to solve the window
+    released: bool = False
+
+
+#Period of the index of a variable or constraint, all of which are indexed by i or (i, s)
+def index_period(index):
+    return index[0] if isinstance(index, tuple) else index
+
+
+#Solve a built model window by window with solve, e.g. the solve function of a model script
+#Each window covers window periods, of which the first step are fixed before moving on; the solution of every period is left in the model
+def rolling_horizon_solve(model, solve, window, step = 1, **solve_options):
+    if not 1 <= step <= window:
+        raise ValueError('The step of the rolling horizon must be between 1 and the window length %d' % window)
+    periods = list(model.periods)
+    constraints = [con for con in model.component_data_objects(pyo.Constraint, active = True)]
+    variables = [v for v in model.component_data_objects(pyo.Var) if not v.fixed]
+    fixed = ComponentSet()
+    reports = []
+    solved = (pyo.TerminationCondition.optimal, pyo.TerminationCondition.maxTimeLimit)
+
+    try:
+        start = 0
+        while start < len(periods):
+            first, last = periods[start], periods[min(start + window, len(periods)) - 1]
+            for con in constraints:
+                if index_period(con.index()) > last:
+                    con.deactivate()
+                else:
+                    con.activate()
+
+            begin = time.perf_counter()
+            results = solve(model, **solve_options)
+            condition = results.solver.termination_condition
+            released = False
+            if condition not in solved and any(not v.is_integer() for v in fixed):
+                for v in [v for v in fixed if not v.is_integer()]:
+                    v.unfix()
+                    fixed.remove(v)
+                released = True
+                results = solve(model, **solve_options)
+                condition = results.solver.termination_condition
+            if condition not in solved:
+                raise RuntimeError('The window of periods %d to %d could not be solved with the decisions of the earlier periods fixed (%s)' % (first, last, condition))
+
+            #The last window commits all of its periods
+            committed = periods[start:start + step] if last != periods[-1] else periods[start:]
+            for v in variables:
+                if index_period(v.index()) in committed and v.value is not None:
+                    value = round(v.value) if v.is_integer() else v.value
+                    if v.lb is not None:
+                        value = max(value, v.lb)
+                    if v.ub is not None:
+                        value = min(value, v.ub)
+                    v.fix(value)
+                    fixed.add(v)
+            reports.append(WindowReport(first, last, committed, str(condition), time.perf_counter() - begin, released))
+            start += len(committed)
+    finally:
+        for con in constraints:
+            con.activate()
+        for v in fixed:
+            v.unfix()
+
+    return reports
@@ -0,0 +1,138 @@
+'''
+Created on 18th October 2026
+
+Parallel scenario sweeps over a process pool
+
+A scenario used to be one manual run of Optimal_Decarbonisation_Run_File.py.
+A sweep instead takes a list of scenarios, each a set of overrides of the
+input data, and builds and solves every multiperiod_energy_planning instance
+in a pool of worker processes. Results are handed back as each scenario
+finishes.
+
+An override is keyed by (table, column) of the PlanningInputs, e.g.
+('EP', 'Limit'), ('fuel', 'COAL') or ('CCS_data', 'Cost_CCS_1'). A number
+scales every value of the column, and a dict {period: value} replaces the
+values of the given periods. For the 'plant' table the column is a plant
+data column such as 'CI', and a dict is keyed by plant instead of period.
+
+Every worker keeps its built models in a TemplateCache, so scenarios with
+the same structure only update the parameters of a model that the worker
+has already built.
+
+'''
+import copy
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+import pyomo.environ as pyo
+
+from Model_Template import TemplateCache
+from Results_Store import tidy_results
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    overrides: dict
+
+    #Termination condition reported by the solver, or 'error' if the scenario failed
+    status: str = 'error'
+    objective: float = None
+
+    #Results tables of every period, {period: DataFrame}, and the tidy table of Results_Store
+    tables: dict = None
+    tidy: object = None
+
+    #Wall clock time of building and solving the scenario in seconds
+    seconds: float = 0.0
+    error: str = None
+
+
+#Copy of the inputs with the overrides of a scenario applied
+def apply_overrides(inputs, overrides):
+    inputs = copy.deepcopy(inputs)
+    for (table, column), value in overrides.items():
+        data = getattr(inputs, table)
+        if table == 'plant':
+            cells = {s: data[s] for s in data}
+        elif column in data:
+            cells = {p: data[column] for p in data[column]}
+        else:
+            raise ValueError("Table '%s' has no column '%s'" % (table, column))
+
+        for key, row in cells.items():
+            if isinstance(value, dict):
+                if key in value:
+                    row[column if table == 'plant' else key] = value[key]
+            else:
+                row[column if table == 'plant' else key] *= value
+    return inputs
+
+
+#Every combination of the values of the axes, e.g. {('EP', 'Limit'): [0.8, 1.0], ('fuel', 'COAL'): [1.0, 1.5]}, as a list of (name, overrides)
+def scenario_grid(axes):
+    scenarios = []
+    for values in itertools.product(*axes.values()):
+        overrides = dict(zip(axes, values))
+        name = ','.join('%s.%s=%s' % (table, column, value) for (table, column), value in overrides.items())
+        scenarios.append((name, overrides))
+    return scenarios
+
+
+#State of a worker process, set once by _init_worker
+_worker = {}
+
+
+def _init_worker(model_module, inputs, solve_options):
+    import importlib
+    module = importlib.import_module(model_module)
+    _worker['module'] = module
+    _worker['inputs'] = inputs
+    _worker['solve_options'] = solve_options
+    _worker['cache'] = TemplateCache(module.build_model)
+
+
+def _solve_scenario(name, overrides):
+    start = time.perf_counter()
+    result = ScenarioResult(name, overrides)
+    try:
+        module = _worker['module']
+        model = _worker['cache'].model_for(apply_overrides(_worker['inputs'], overrides))
+        results = module.solve(model, **_worker['solve_options'])
+        result.status = str(results.solver.termination_condition)
+        if results.solver.termination_condition in (pyo.TerminationCondition.optimal, pyo.TerminationCondition.maxTimeLimit):
+            result.objective = pyo.value(model.obj, exception = False)
+            result.tables = module.extract_results(model)
+            result.tidy = tidy_results(model, name)
+    except Exception as e:
+        result.error = '%s: %s' % (type(e).__name__, e)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+#Solve the scenarios, a list of (name, overrides), in worker processes and yield a ScenarioResult as each one finishes
+#threads is the number of solver threads of every worker, and workers defaults to as many workers as the cores allow
+#With a Results_Store.ResultsStore as store, the tidy results of every solved scenario are written as soon as it finishes
+def sweep(inputs, scenarios, model_module = 'Optimal_Decarbonisation_Model_Python', workers = None, threads = 1, store = None, **solve_options):
+    names = [name for name, _ in scenarios]
+    if len(set(names)) != len(names):
+        raise ValueError('The scenario names are not unique')
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 1) // threads)
+    solve_options['threads'] = threads
+
+    with ProcessPoolExecutor(max_workers = workers, initializer = _init_worker, initargs = (model_module, inputs, solve_options)) as pool:
+        futures = [pool.submit(_solve_scenario, name, overrides) for name, overrides in scenarios]
+        for future in as_completed(futures):
+            result = future.result()
+            if store is not None and result.tidy is not None:
+                store.add_table(result.tidy)
+            yield result
+
+
+#Run a complete sweep and collect the results, {name: ScenarioResult}
+def run_sweep(inputs, scenarios, model_module = 'Optimal_Decarbonisation_Model_Python', workers = None, threads = 1, store = None, **solve_options):
+    return {result.name: result for result in sweep(inputs, scenarios, model_module, workers, threads, store, **solve_options)}
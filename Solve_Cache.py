@@ -0,0 +1,190 @@
+'''
+Created on 18th October 2026
+
+Memoized solves keyed by a fingerprint of the model inputs
+
+The same base case and the same few policy variants are solved again and
+again. This module keys every optimal solution on the SHA-256 of the
+canonicalised data of the model (all parsed tables, flag, AFF and the number
+of periods), the ModelVariant it was built with and the solver settings, and
+stores the values of all variables. A repeat request loads the stored values
+into the model instead of calling the solver.
+
+The solutions are kept next to the cached workbooks of Input_Cache, in the
+solutions folder of the same cache directory, so a shared cache directory
+serves every user. Every entry is a JSON file holding the termination
+condition, the objective and the values of every variable, so loading an
+entry written by another user never executes code. The cache is evicted in the same way: entries unused for
+longer than max_age go first, then the least recently used entries until the
+cache fits in max_bytes.
+
+Only solves that terminate optimally are stored, since a time-limited solve
+may find a different solution on another run.
+
+'''
+import hashlib
+import math
+import json
+import os
+import tempfile
+from dataclasses import dataclass, fields, is_dataclass
+
+import pyomo.environ as pyo
+
+from Input_Cache import CACHE_DIR, MAX_AGE, evict
+from Model_Template import PERIOD_TABLES
+from Solver_Backends import default_backend
+from Technology_Catalogue import technology_catalogue
+
+
+#The solution cache holds fewer, larger entries than the workbook cache
+MAX_BYTES = 1024 * 1024 * 1024
+
+#Bump whenever the formulation changes so that stale solutions are never loaded
+CACHE_VERSION = 5
+
+#Data of the model that goes into the fingerprint, as attribute names
+FINGERPRINT_DATA = ('plant',) + PERIOD_TABLES + ('TIME', 'flag', 'AFF', 'numperiods')
+
+#Fields of the ModelVariant that shape the formulation, and so go into the fingerprint (see Planning_Engine)
+FINGERPRINT_VARIANT = ('name', 'demand', 'demand_columns', 'big_m_direct', 'plant_monotonicity', 'technologies', 'fuels', 'alternative_solid_fuels')
+
+
+@dataclass
+class SolveRecord:
+    termination_condition: str
+    objective: float
+
+    #Whether the solution was loaded from the cache
+    hit: bool
+
+    #Results object of the solver, None on a cache hit
+    results: object = None
+
+
+#Canonical text of a value, independent of the order of dict entries and of int or float types
+def _canonical(value):
+    if isinstance(value, dict):
+        return '{%s}' % ','.join(sorted('%s:%s' % (_canonical(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return '[%s]' % ','.join(_canonical(v) for v in value)
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return repr(value)
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return repr(value)
+    return 'nan' if math.isnan(number) else repr(number)
+
+
+#Canonical text of a field of a ModelVariant, with plug-in functions by their qualified names and Technology objects by their fields
+def _variant_canonical(value):
+    if is_dataclass(value):
+        return '%s(%s)' % (type(value).__name__, ','.join('%s=%s' % (f.name, _variant_canonical(getattr(value, f.name))) for f in fields(value)))
+    if callable(value):
+        return '%s.%s' % (value.__module__, value.__qualname__)
+    if isinstance(value, dict):
+        return '{%s}' % ','.join(sorted('%s:%s' % (_canonical(k), _variant_canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return '[%s]' % ','.join(_variant_canonical(v) for v in value)
+    return _canonical(value)
+
+
+#SHA-256 of the data of a built model, its variant and technology catalogue, and the solver settings
+#Without a backend in the settings, the backend that Solver_Backends resolves, e.g. from DECO2_SOLVER, is hashed in its place
+def model_fingerprint(model, **solve_options):
+    solve_options = dict(solve_options, backend = solve_options.get('backend') or default_backend())
+    sha = hashlib.sha256()
+    sha.update(repr(CACHE_VERSION).encode())
+    for name in FINGERPRINT_VARIANT:
+        sha.update(name.encode())
+        sha.update(_variant_canonical(getattr(model.variant, name)).encode())
+    sha.update(_canonical(vars(technology_catalogue(model))).encode())
+    for name in FINGERPRINT_DATA:
+        sha.update(name.encode())
+        sha.update(_canonical(getattr(model, name)).encode())
+    sha.update(_canonical(solve_options).encode())
+    return sha.hexdigest()
+
+
+#Values of every variable of the model, {component name: {index: value}}
+def model_solution(model):
+    return {var.name: {index: v.value for index, v in var.items()} for var in model.component_objects(pyo.Var, active = True)}
+
+
+#JSON layout of a solution: [[component name, [[index, value], ...]], ...] with tuple indices as lists
+def _encode_solution(solution):
+    return [[name, [[list(index) if isinstance(index, tuple) else index, value] for index, value in values.items()]] for name, values in solution.items()]
+
+
+def _decode_solution(entries):
+    return {name: {tuple(index) if isinstance(index, list) else index: value for index, value in values} for name, values in entries}
+
+
+def _load_solution(model, solution):
+    for name, values in solution.items():
+        var = model.component(name)
+        for index, value in values.items():
+            var[index].set_value(value, skip_validation = True)
+
+
+#Stored solution of the fingerprint key, {component name: {index: value}}, or None if there is none
+def cached_solution(key, cache_dir = None):
+    path = os.path.join(cache_dir or os.path.join(CACHE_DIR, 'solutions'), key + '.json')
+    entry = _read(path) if os.path.exists(path) else None
+    return None if entry is None else entry['solution']
+
+
+def _read(path):
+    try:
+        with open(path, 'r') as f:
+            entry = json.load(f)
+        entry['solution'] = _decode_solution(entry['solution'])
+        os.utime(path)
+        return entry
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+#Write to a temporary file first so that concurrent runs never read a partially written entry
+def _write(path, entry):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        fd, tmp = tempfile.mkstemp(dir = os.path.dirname(path), suffix = '.tmp')
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(dict(entry, solution = _encode_solution(entry['solution'])), f)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+#Solve the model with solve, e.g. the solve function of a model script, unless an optimal solution of the same inputs and settings is cached
+def cached_solve(model, solve, cache_dir = None, max_bytes = MAX_BYTES, max_age = MAX_AGE, **solve_options):
+    cache_dir = cache_dir or os.path.join(CACHE_DIR, 'solutions')
+    path = os.path.join(cache_dir, model_fingerprint(model, **solve_options) + '.json')
+
+    if os.path.exists(path):
+        entry = _read(path)
+        if entry is not None:
+            _load_solution(model, entry['solution'])
+            return SolveRecord(entry['termination_condition'], entry['objective'], True)
+
+    results = solve(model, **solve_options)
+    termination_condition = str(results.solver.termination_condition)
+    if results.solver.termination_condition != pyo.TerminationCondition.optimal:
+        return SolveRecord(termination_condition, None, False, results)
+
+    objective = pyo.value(model.obj)
+    _write(path, {'termination_condition': termination_condition, 'objective': objective, 'solution': model_solution(model)})
+    evict(cache_dir, max_bytes, max_age, '.json')
+    return SolveRecord(termination_condition, objective, False, results)
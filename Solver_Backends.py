@@ -0,0 +1,146 @@
+'''
+Created on 18th October 2026
+
+Solver backends for the DECO2 energy planning models
+
+The models were originally solved with CPLEX through GAMS only. This module
+keeps a registry of solver backends so the same model can be solved with
+GAMS-CPLEX, in-process HiGHS (through highspy), CBC, GLPK or Gurobi, selected
+by name either as an argument or through the DECO2_SOLVER environment
+variable.
+
+Every backend accepts the same options (time limit in seconds, relative MIP
+gap and number of threads) and translates them into the option names of its
+solver. Options that a solver does not support are ignored. With warmstart,
+the current values of the variables are passed to the solver as a MIP start
+(see MIP_Start). GAMS uses CPLEX unless the DECO2_GAMS_SOLVER environment
+variable names another of its solvers, in which case the CPLEX option file
+of the MIP start is not written.
+
+'''
+import os
+import shutil
+import tempfile
+from pyomo.opt import SolverFactory
+
+
+#Backend used when none is given, which may be overridden with the DECO2_SOLVER environment variable (see default_backend)
+DEFAULT_BACKEND = 'gams'
+
+#Solver used by GAMS, which may be overridden with the DECO2_GAMS_SOLVER environment variable
+GAMS_SOLVER = 'cplex'
+
+#Registered backends, keyed by name
+BACKENDS = {}
+
+
+#Register a backend: solve_function(model, time_limit, mip_gap, threads, tee, warmstart) must return the Pyomo results object
+def register_backend(name, solve_function):
+    BACKENDS[name] = solve_function
+
+
+def _check_available(opt, name):
+    if not opt.available(exception_flag = False):
+        raise RuntimeError("Solver backend '%s' is not available on this machine" % name)
+
+
+#CPLEX through GAMS, as used by the original model scripts, or the GAMS solver named by DECO2_GAMS_SOLVER
+def _solve_gams(model, time_limit, mip_gap, threads, tee, warmstart):
+    opt = SolverFactory('gams')
+    _check_available(opt, 'gams')
+    solver = os.environ.get('DECO2_GAMS_SOLVER', GAMS_SOLVER)
+    add_options = []
+    if time_limit is not None:
+        add_options.append('option reslim = %s;' % time_limit)
+    if mip_gap is not None:
+        add_options.append('option optcr = %s;' % mip_gap)
+    if threads is not None:
+        add_options.append('option threads = %s;' % threads)
+
+    #GAMS receives the variable values as levels, which CPLEX only uses as a MIP start with the mipstart option
+    #The option file is written to the working directory of the run, which GAMS reads option files from
+    tmpdir = tempfile.mkdtemp(prefix = 'deco2_gams_')
+    try:
+        if warmstart and solver.lower() == 'cplex':
+            with open(os.path.join(tmpdir, 'cplex.opt'), 'w') as f:
+                f.write('mipstart 1\n')
+            add_options.append('GAMS_MODEL.optfile = 1;')
+        return opt.solve(model, solver = solver, tee = tee, add_options = add_options, tmpdir = tmpdir)
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors = True)
+
+
+#HiGHS in-process through highspy, which avoids writing and reading problem files
+def _solve_highs(model, time_limit, mip_gap, threads, tee, warmstart):
+    opt = SolverFactory('appsi_highs')
+    _check_available(opt, 'highs')
+    options = {}
+    if time_limit is not None:
+        options['time_limit'] = float(time_limit)
+    if mip_gap is not None:
+        options['mip_rel_gap'] = float(mip_gap)
+    if threads is not None:
+        options['threads'] = int(threads)
+    #Like the other backends, an infeasible model is reported in the results instead of raising an error
+    results = opt.solve(model, tee = tee, options = options, warmstart = warmstart, load_solutions = False)
+    #Once loaded, the values are dropped from the results, as the other backends do when they load their solution
+    if len(results.solution):
+        model.solutions.load_from(results)
+        results.solution.clear()
+    return results
+
+
+def _solve_cbc(model, time_limit, mip_gap, threads, tee, warmstart):
+    opt = SolverFactory('cbc')
+    _check_available(opt, 'cbc')
+    if time_limit is not None:
+        opt.options['sec'] = time_limit
+    if mip_gap is not None:
+        opt.options['ratio'] = mip_gap
+    if threads is not None:
+        opt.options['threads'] = threads
+    return opt.solve(model, tee = tee, warmstart = warmstart)
+
+
+#GLPK is single-threaded and takes no MIP start, so the threads and warmstart options are ignored
+def _solve_glpk(model, time_limit, mip_gap, threads, tee, warmstart):
+    opt = SolverFactory('glpk')
+    _check_available(opt, 'glpk')
+    if time_limit is not None:
+        opt.options['tmlim'] = int(time_limit)
+    if mip_gap is not None:
+        opt.options['mipgap'] = mip_gap
+    return opt.solve(model, tee = tee)
+
+
+def _solve_gurobi(model, time_limit, mip_gap, threads, tee, warmstart):
+    opt = SolverFactory('gurobi', solver_io = 'python')
+    _check_available(opt, 'gurobi')
+    if time_limit is not None:
+        opt.options['TimeLimit'] = time_limit
+    if mip_gap is not None:
+        opt.options['MIPGap'] = mip_gap
+    if threads is not None:
+        opt.options['Threads'] = threads
+    return opt.solve(model, tee = tee, warmstart = warmstart)
+
+
+register_backend('gams', _solve_gams)
+register_backend('highs', _solve_highs)
+register_backend('cbc', _solve_cbc)
+register_backend('glpk', _solve_glpk)
+register_backend('gurobi', _solve_gurobi)
+
+
+#Backend named by the DECO2_SOLVER environment variable, or DEFAULT_BACKEND
+#The variable is read on every call, so setting it later in the process, e.g. in a sweep worker or a notebook, takes effect
+def default_backend():
+    return os.environ.get('DECO2_SOLVER') or DEFAULT_BACKEND
+
+
+#Solve the model with the named backend, or with the default backend if no name is given
+def solve_with_backend(model, backend = None, time_limit = None, mip_gap = None, threads = None, tee = False, warmstart = False):
+    backend = backend or default_backend()
+    if backend not in BACKENDS:
+        raise ValueError("Unknown solver backend '%s', expected one of %s" % (backend, ', '.join(sorted(BACKENDS))))
+    return BACKENDS[backend](model, time_limit, mip_gap, threads, tee, warmstart)
@@ -0,0 +1,40 @@
+'''
+Created on 18th October 2026
+
+Sparse index sets for the power plant variables
+
+The plant variables of multiperiod_energy_planning used to be created for
+every (period, plant) pair, although most of them can only be non-zero for
+some pairs: energy only within the operating window of plant s, CCS only for
+fossil-based plants, alternative solid fuels only for coal-based plants,
+alternative gas fuels only for natural gas-based plants, and every
+technology only from its implementation period onwards (TIME).
+
+The helpers below build the (period, plant) pairs for which a variable is
+created. A variable that does not exist for a pair takes the value 0, which
+is what sparse returns, so the constraints can refer to any pair.
+
+'''
+
+
+#(period, plant) pairs in which power plant s is in operation, from its commissioning period up to the period before its decommissioning period
+def operating_window(plant, periods):
+    return [(i, s) for i in periods for s in plant if plant[s]['ON'] <= i < plant[s]['OFF']]
+
+
+#Pairs of the operating window in which a technology may be deployed in power plant s, given its implementation times in TIME
+#The deployment of a technology may not decrease from one period to the next, so a pair is only kept if the technology
+#can also be deployed in every later period, e.g. CCS is never deployed in a plant that is decommissioned within the planning horizon
+def technology_window(window, plants, time, periods):
+    pairs = {(i, s) for (i, s) in window if s in plants and time[i] == 'YES'}
+    return [(i, s) for (i, s) in window if (i, s) in pairs and all((j, s) in pairs for j in periods if j > i)]
+
+
+#(period, plant, option) triples in which each of the options of a technology class, e.g. the CCS options, may be deployed in power plant s
+def option_window(window, plants, time, options, periods):
+    return [(i, s, k) for k in options for (i, s) in technology_window(window, plants, time[k], periods)]
+
+
+#Variable var at the given index, or 0 if the variable was not created for it
+def sparse(var, *index):
+    return var[index] if index in var else 0
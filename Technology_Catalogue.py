@@ -0,0 +1,68 @@
+'''
+Created on 18th October 2026
+
+Technology catalogues of the planning model
+
+The formulation used to hard-code two CCS options, two alternative solid
+fuels, two alternative gas fuels, three EP-NETs, three EC-NETs and five
+compensatory renewables, each with its own variables and constraints. The
+options of every technology class are now read from the columns of the input
+tables instead:
+
+    ccs         CCS_n for every RR_n column of CCS_data, whose removal ratio,
+                energy penalty and costs are RR_n, X_n, Cost_CCS_n and
+                FX_Cost_CCS_n
+    solid       the columns of SLD_CI
+    gas         the columns of GAS_CI
+    ep_nets     the columns of NET_CI starting with EP_
+    ec_nets     the columns of NET_CI starting with EC_
+    renewables  the columns of REN_CI
+
+Only options with an implementation time in TIME belong to a catalogue, in the
+order of the TIME table, e.g. the purchased ELECTRICITY of the Industry
+workbook is not a compensatory renewable but a technology of its variant.
+multiperiod_energy_planning creates one indexed variable and constraint family
+per class, so adding an option to the workbook adds no code.
+
+'''
+from dataclasses import dataclass
+
+
+@dataclass
+class TechnologyCatalogue:
+    ccs: list
+    solid: list
+    gas: list
+    ep_nets: list
+    ec_nets: list
+    renewables: list
+
+    @property
+    def nets(self):
+        return self.ep_nets + self.ec_nets
+
+
+#Catalogue of the technology options in a PlanningInputs object, or in a model built from one
+def technology_catalogue(data):
+    time = list(data.TIME)
+    ccs = ['CCS_' + c[len('RR_'):] for c in data.CCS_data if c.startswith('RR_')]
+    for k in ccs:
+        missing = [c for c in ccs_columns(k) if c not in data.CCS_data]
+        if missing:
+            raise ValueError('CCS option %s has no CCS data %s' % (k, ', '.join(missing)))
+    nets = list(data.NET_CI)
+    other = [c for c in nets if not c.startswith('EP_') and not c.startswith('EC_')]
+    if other:
+        raise ValueError('NETs %s are neither EP_ nor EC_ NETs' % ', '.join(other))
+
+    def options(columns):
+        return [k for k in time if k in columns]
+
+    return TechnologyCatalogue(options(ccs), options(data.SLD_CI), options(data.GAS_CI), options([c for c in nets if c.startswith('EP_')]),
+                               options([c for c in nets if c.startswith('EC_')]), options(data.REN_CI))
+
+
+#Columns of CCS_data of CCS option k: removal ratio, energy penalty, variable cost and fixed cost, e.g. RR_1, X_1, Cost_CCS_1 and FX_Cost_CCS_1
+def ccs_columns(k):
+    n = k[len('CCS_'):]
+    return 'RR_' + n, 'X_' + n, 'Cost_' + k, 'FX_Cost_' + k
@@ -0,0 +1,254 @@
+'''
+Created on 18th October 2026
+
+Per-phase and per-constraint timing traces
+
+A TimingTrace collects timing events of one or more runs of a model script,
+each with the run, the phase, the name of what was timed, its kind, its
+number of indices and the wall time in seconds. traced_run times a complete
+run phase by phase:
+
+    load        module.load_inputs, i.e. the (cached) workbook parsing
+    build       every component constructed by module.build_model, e.g.
+                one event per Cons_* family, Var, Param and Set, using the
+                construction timers of Pyomo
+    presolve    the presolve and its undo
+    write       writing the problem for the solver: the problem file of the
+                file-based backends (GAMS, CBC, GLPK) or the translation of
+                the model into the in-process HiGHS model
+    read        reading the results of the CBC, GLPK and Gurobi backends
+    solver      the rest of the backend call, i.e. the solver itself
+    results     module.extract_results
+    export      module.write_results, if an output workbook is given
+
+Traces are written as JSON lines or CSV, and aggregate combines the events
+of a batch of runs into one row per phase and name, so the constraint rules
+and I/O steps that dominate the wall time stand out.
+
+Run from the command line, e.g.
+
+    python Timing_Trace.py --workbook Optimal_Decarbonisation_User_Interface.xlsx --runs 3 --backend highs --output trace.csv
+
+'''
+import argparse
+import importlib
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+import pandas as pd
+from pyomo.common.timing import ConstructionTimer
+from pyomo.core.base.block import BlockData
+from pyomo.opt.base.solvers import OptSolver
+
+from Model_Presolve import presolve, undo_presolve
+from Workbook_Loader import default_workbook
+
+
+#Columns of a trace table
+TRACE_COLUMNS = ['run', 'phase', 'name', 'kind', 'count', 'seconds']
+
+
+class TimingTrace:
+    def __init__(self, run = 0):
+        self.run = run
+        self.events = []
+
+    def add(self, phase, seconds, name = '', kind = '', count = None):
+        self.events.append({'run': self.run, 'phase': phase, 'name': name, 'kind': kind, 'count': count, 'seconds': seconds})
+
+    #Time the enclosed block as one event
+    @contextmanager
+    def phase(self, phase, name = '', kind = '', count = None):
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.add(phase, time.perf_counter() - start, name, kind, count)
+
+    def table(self):
+        return pd.DataFrame(self.events, columns = TRACE_COLUMNS)
+
+    #Write the events as JSON lines, or as CSV if the path ends in .csv
+    def write(self, path):
+        if path.endswith('.csv'):
+            self.table().to_csv(path, index = False)
+        else:
+            with open(path, 'w') as f:
+                for event in self.events:
+                    f.write(json.dumps(event) + '\n')
+
+
+#Combine the events of several traces, or of a trace table, into one row per phase and name, with its share of the total time
+#events is the number of events per run, e.g. the unnamed sets of the sparse index sets, and count the largest number of indices
+def aggregate(traces):
+    if isinstance(traces, pd.DataFrame):
+        table = traces
+    else:
+        table = pd.concat([trace.table() for trace in traces], ignore_index = True)
+    runs = max(1, table['run'].nunique())
+    summary = table.groupby(['phase', 'name', 'kind'], sort = False).agg(
+        events = ('seconds', 'size'), count = ('count', 'max'), total_seconds = ('seconds', 'sum'),
+        mean_seconds = ('seconds', 'mean'), max_seconds = ('seconds', 'max')).reset_index()
+    summary['events'] = summary['events'] // runs
+    summary['share'] = summary['total_seconds'] / table['seconds'].sum()
+    return summary.sort_values('total_seconds', ascending = False)
+
+
+class _ConstructionHandler(logging.Handler):
+    def __init__(self, trace):
+        logging.Handler.__init__(self)
+        self.trace = trace
+
+    def emit(self, record):
+        timer = record.msg
+        if not isinstance(timer, ConstructionTimer):
+            return
+        try:
+            kind = timer.obj.ctype.__name__
+            count = len(timer.obj) if timer.obj.is_indexed() else 1
+        except (AttributeError, TypeError):
+            kind, count = type(timer.obj).__name__, None
+        self.trace.add('build', timer.timer, timer.name, kind, count)
+
+
+#Record the construction time of every component built within the block as a build event
+@contextmanager
+def construction_timing(trace):
+    logger = logging.getLogger('pyomo.common.timing.construction')
+    handler = _ConstructionHandler(trace)
+    level, propagate = logger.level, logger.propagate
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    try:
+        yield trace
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+        logger.propagate = propagate
+
+
+#Methods of the solver interfaces that write the problem or read the results: (class, method name, phase)
+def _io_methods():
+    methods = [(BlockData, 'write', 'write')]
+    classes = [OptSolver]
+    while classes:
+        cls = classes.pop()
+        classes.extend(cls.__subclasses__())
+        if '_postsolve' in vars(cls):
+            methods.append((cls, '_postsolve', 'read'))
+    try:
+        from pyomo.contrib.appsi.solvers.highs import Highs
+        methods.append((Highs, 'set_instance', 'write'))
+    except ImportError:
+        pass
+    return methods
+
+
+#Record the problem writes and results reads of the solver interfaces within the block as write and read events
+#Only the outermost call is timed, as the methods of the solver classes call those of their base classes
+@contextmanager
+def solver_io_timing(trace):
+    depth = threading.local()
+
+    def timed(method, phase):
+        def wrapper(*args, **kwargs):
+            if getattr(depth, 'value', 0):
+                return method(*args, **kwargs)
+            depth.value = 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                depth.value = 0
+                trace.add(phase, time.perf_counter() - start, type(args[0]).__name__, 'solver')
+        return wrapper
+
+    patched = []
+    for cls, name, phase in _io_methods():
+        method = vars(cls)[name]
+        setattr(cls, name, timed(method, phase))
+        patched.append((cls, name, method))
+    try:
+        yield trace
+    finally:
+        for cls, name, method in patched:
+            setattr(cls, name, method)
+
+
+#Solve a built model with module.solve, recording the presolve, the solver I/O and the remaining solver time
+def traced_solve(trace, module, model, **solve_options):
+    with trace.phase('presolve', 'presolve'):
+        presolve(model)
+    try:
+        io_events = len(trace.events)
+        start = time.perf_counter()
+        with solver_io_timing(trace):
+            results = module.solve(model, presolve = False, **solve_options)
+        seconds = time.perf_counter() - start
+        io_seconds = sum(event['seconds'] for event in trace.events[io_events:])
+        trace.add('solver', seconds - io_seconds, solve_options.get('backend') or 'default')
+    finally:
+        with trace.phase('presolve', 'undo_presolve'):
+            undo_presolve(model)
+    return results
+
+
+#Time one run of model_module on the workbook at path, by default the example workbook of the model (see Workbook_Loader), phase by phase, adding the events to trace
+#The results are written to output_path if one is given, and the solved model is returned
+def traced_run(trace, model_module = 'Optimal_Decarbonisation_Model_Python', path = None, output_path = None, **solve_options):
+    module = importlib.import_module(model_module)
+    path = path or default_workbook(module)
+    with trace.phase('load', path):
+        inputs = module.load_inputs(path)
+    #The time of the build outside the construction of the components, e.g. of the sparse index sets, is recorded as other
+    build_events = len(trace.events)
+    start = time.perf_counter()
+    with construction_timing(trace):
+        model = module.build_model(inputs)
+    seconds = time.perf_counter() - start
+    trace.add('build', seconds - sum(event['seconds'] for event in trace.events[build_events:]), 'other')
+    traced_solve(trace, module, model, **solve_options)
+    with trace.phase('results', 'extract_results'):
+        results = module.extract_results(model)
+    if output_path is not None:
+        with trace.phase('export', output_path):
+            module.write_results(results, path, output_path)
+    return model
+
+
+#Time a batch of runs, returning their traces
+def traced_batch(runs, model_module = 'Optimal_Decarbonisation_Model_Python', path = None, output_path = None, **solve_options):
+    traces = []
+    for run in range(runs):
+        trace = TimingTrace(run)
+        traced_run(trace, model_module, path, output_path, **solve_options)
+        traces.append(trace)
+    return traces
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Time the phases and constraint families of the energy planning model')
+    parser.add_argument('--model', default = 'Optimal_Decarbonisation_Model_Python')
+    parser.add_argument('--workbook', default = None, help = 'user interface workbook, by default the example workbook of the model')
+    parser.add_argument('--results-workbook', default = None, help = 'also time writing the results to this workbook')
+    parser.add_argument('--runs', type = int, default = 1)
+    parser.add_argument('--backend', default = None)
+    parser.add_argument('--time-limit', type = float, default = None)
+    parser.add_argument('--mip-gap', type = float, default = None)
+    parser.add_argument('--output', default = 'trace.jsonl', help = 'trace of every event, as JSON lines or .csv')
+    parser.add_argument('--summary', default = None, help = 'CSV of the events aggregated over the runs')
+    args = parser.parse_args()
+
+    traces = traced_batch(args.runs, args.model, args.workbook, args.results_workbook, backend = args.backend,
+                          time_limit = args.time_limit, mip_gap = args.mip_gap)
+    trace = TimingTrace()
+    trace.events = [event for t in traces for event in t.events]
+    trace.write(args.output)
+    summary = aggregate(traces)
+    if args.summary is not None:
+        summary.to_csv(args.summary, index = False)
+    print(summary.head(20).to_string(index = False))
@@ -0,0 +1,172 @@
+'''
+Created on 18th October 2026
+
+Single-pass loader for the DECO2 user interface workbooks
+
+The model scripts previously parsed the same workbook 15 times with
+pd.read_excel and then opened it once more with load_workbook to read the
+objective flag, the number of periods and the annualisation factor.
+
+This loader opens the workbook once in read-only streaming mode, walks every
+sheet that the model needs exactly once and extracts both the data tables and
+the scalar cells along the way. The tables are returned in the same
+{column: {index: value}} layout produced by pd.read_excel(...).to_dict(), so
+the formulation can use them unchanged.
+
+'''
+import os
+from dataclasses import dataclass
+from openpyxl import load_workbook
+
+
+#Example workbook shipped with the repository for each model script
+#The file_name of a script names the workbook of the original study, which is not shipped
+SHIPPED_WORKBOOKS = {
+    'Base_Model_Python': 'Base_User_Interface.xlsx',
+    'Industry_Model_Python': 'Industry_User_Interface.xlsx',
+    'Optimal_Decarbonisation_Model_Python': 'Optimal_Decarbonisation_User_Interface.xlsx',
+    }
+
+#Location of each data table: (sheet name, header row as counted by pd.read_excel, number of rows or None for all rows)
+SHEET_BLOCKS = {
+    'plant': ('PLANT_DATA', 32, 7),
+    'EP': ('ENERGY_PLANNING_DATA', 7, None),
+    'fuel': ('FUEL_COST_DATA', 12, None),
+    'REN_CI': ('RENEWABLE_CI_DATA', 9, None),
+    'REN_COST': ('RENEWABLE_COST_DATA', 9, None),
+    'CPX_1': ('CAPEX_DATA_1', 20, None),
+    'CPX_2': ('CAPEX_DATA_2', 20, None),
+    'SLD_CI': ('ALT_SOLID_CI', 6, None),
+    'SLD_COST': ('ALT_SOLID_COST', 6, None),
+    'GAS_CI': ('ALT_GAS_CI', 6, None),
+    'GAS_COST': ('ALT_GAS_COST', 6, None),
+    'CCS_data': ('CCS_DATA', 12, None),
+    'NET_CI': ('NET_CI_DATA', 12, None),
+    'NET_COST': ('NET_COST_DATA', 12, None),
+    'TIME': ('TECH_IMPLEMENTATION_TIME', 19, None),
+    }
+
+#Location of each scalar input: (sheet name, row, column), both counted from 1
+SCALAR_CELLS = {
+    'flag': ('PLANT_DATA', 30, 2),
+    'numperiods': ('PLANT_DATA', 31, 2),
+    'AFF': ('CAPEX_DATA_1', 18, 2),
+    }
+
+
+@dataclass
+class PlanningInputs:
+    #Data tables in the {column: {index: value}} layout of DataFrame.to_dict()
+    plant: dict
+    EP: dict
+    fuel: dict
+    REN_CI: dict
+    REN_COST: dict
+    CPX_1: dict
+    CPX_2: dict
+    SLD_CI: dict
+    SLD_COST: dict
+    GAS_CI: dict
+    GAS_COST: dict
+    CCS_data: dict
+    NET_CI: dict
+    NET_COST: dict
+    TIME: dict
+
+    #Objective function selection, either 'min_budget' or the minimum emission objective
+    flag: str
+
+    #Number of planning periods plus one, so that range(1, numperiods) lists the periods
+    numperiods: int
+
+    #Annualisation factor applied to capital costs
+    AFF: float
+
+    @property
+    def periods(self):
+        return list(range(1, self.numperiods, 1))
+
+
+#Convert a cell value the same way as the openpyxl reader of pandas
+def _cell_value(value):
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+#Columns holding only numbers are promoted to float if any entry is a float or missing, as pandas does
+def _column_values(values):
+    numbers = [v for v in values if v is not None]
+    numeric = all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in numbers)
+    if numeric and (len(numbers) < len(values) or any(isinstance(v, float) for v in numbers)):
+        return [float('nan') if v is None else float(v) for v in values]
+    return [float('nan') if v is None else v for v in values]
+
+
+#Build the {column: {index: value}} dictionary of a table from its header row and data rows
+def _table(rows, header, nrows):
+    width = max([len(row) for row in rows] + [0])
+    rows = [list(row) + [None] * (width - len(row)) for row in rows]
+
+    header_row = rows[header] if header < len(rows) else [None] * width
+    body = [row for row in rows[header + 1:] if any(v is not None for v in row)]
+    if nrows is not None:
+        body = rows[header + 1:header + 1 + nrows]
+
+    columns = []
+    for j, name in enumerate(header_row[1:], start = 1):
+        if name is None:
+            name = 'Unnamed: %d' % j
+        base, k = name, 1
+        while name in columns:
+            name = '%s.%d' % (base, k)
+            k += 1
+        columns.append(name)
+
+    index = _column_values([row[0] for row in body])
+    table = {}
+    for j, name in enumerate(columns, start = 1):
+        table[name] = dict(zip(index, _column_values([row[j] for row in body])))
+    return table
+
+
+#Read every data table and scalar cell used by the model in a single pass through the workbook
+def load_workbook_data(file_name):
+    wb = load_workbook(file_name, read_only = True, data_only = True)
+
+    wanted_blocks = {}
+    for key, (sheet, header, nrows) in SHEET_BLOCKS.items():
+        wanted_blocks.setdefault(sheet, []).append((key, header, nrows))
+    wanted_cells = {}
+    for key, (sheet, row, col) in SCALAR_CELLS.items():
+        wanted_cells.setdefault(sheet, []).append((key, row, col))
+
+    data = {}
+    try:
+        for sheet in dict.fromkeys(list(wanted_blocks) + list(wanted_cells)):
+            rows = []
+            for row in wb[sheet].iter_rows(values_only = True):
+                row = [_cell_value(v) for v in row]
+                while row and row[-1] is None:
+                    row.pop()
+                rows.append(row)
+            while rows and not rows[-1]:
+                rows.pop()
+
+            for key, row, col in wanted_cells.get(sheet, []):
+                cells = rows[row - 1] if row <= len(rows) else []
+                data[key] = cells[col - 1] if col <= len(cells) else None
+            for key, header, nrows in wanted_blocks.get(sheet, []):
+                data[key] = _table(rows, header, nrows)
+    finally:
+        wb.close()
+
+    data['numperiods'] = data['numperiods'] + 1
+    return PlanningInputs(**data)
+
+
+#Workbook of a model script when no path is given: its file_name if that workbook exists, otherwise the shipped example workbook
+def default_workbook(module):
+    if os.path.exists(module.file_name) or module.__name__ not in SHIPPED_WORKBOOKS:
+        return module.file_name
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), SHIPPED_WORKBOOKS[module.__name__])
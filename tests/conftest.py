@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+#The model scripts and the shipped workbooks live in the root of the repository
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+#Keep the input and solve caches of the tests out of the cache of the user
+os.environ['DECO2_CACHE_DIR'] = tempfile.mkdtemp(prefix = 'deco2_test_cache_')
@@ -0,0 +1,46 @@
+import copy
+import os
+
+import pytest
+
+import Industry_Model_Python as industry
+from conftest import ROOT
+
+
+@pytest.fixture
+def inputs():
+    return industry.load_inputs(os.path.join(ROOT, 'Industry_User_Interface.xlsx'))
+
+
+def _tables(inputs):
+    return copy.deepcopy((inputs.plant, inputs.EP, inputs.fuel))
+
+
+def test_session_update_leaves_inputs_unchanged(inputs):
+    pytest.importorskip('highspy')
+    from Persistent_Session import PlanningSession
+
+    before = _tables(inputs)
+    model = industry.build_model(inputs)
+    session = PlanningSession(model, 'highs')
+    fuel = next(iter(inputs.fuel))
+    for i in model.periods:
+        session.set_limit(i, 0.9 * inputs.EP['Limit'][i])
+        session.set_budget(i, 2 * inputs.EP['Budget'][i])
+        session.set_fuel_cost(fuel, i, 3 * inputs.fuel[fuel][i])
+
+    assert _tables(inputs) == before
+    assert model.EP['Limit'][1] == pytest.approx(0.9 * inputs.EP['Limit'][1])
+    assert model.EP is not inputs.EP
+
+
+def test_update_model_leaves_inputs_unchanged(inputs):
+    from Model_Template import update_model
+
+    before = _tables(inputs)
+    model = industry.build_model(copy.deepcopy(inputs))
+    update_model(model, inputs)
+    model.EP['Limit'][1] = 0
+    model.fuel[next(iter(model.fuel))][1] = 0
+
+    assert _tables(inputs) == before
@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+import Base_Model_Python as base
+import Industry_Model_Python as industry
+import Optimal_Decarbonisation_Model_Python as optimal
+from conftest import ROOT
+from Solve_Cache import cached_solve, model_fingerprint
+
+
+@pytest.fixture
+def model():
+    return industry.build_model(industry.load_inputs(os.path.join(ROOT, 'Industry_User_Interface.xlsx')))
+
+
+def test_fingerprint_is_stable_across_builds(model):
+    inputs = industry.load_inputs(os.path.join(ROOT, 'Industry_User_Interface.xlsx'))
+    assert model_fingerprint(model, backend = 'highs') == model_fingerprint(industry.build_model(inputs), backend = 'highs')
+
+
+def test_fingerprint_tells_the_variants_apart():
+    inputs = optimal.load_inputs(os.path.join(ROOT, 'Optimal_Decarbonisation_User_Interface.xlsx'))
+    assert model_fingerprint(base.build_model(inputs), backend = 'highs') != model_fingerprint(optimal.build_model(inputs), backend = 'highs')
+
+
+def test_fingerprint_hashes_the_resolved_backend(model, monkeypatch):
+    monkeypatch.setenv('DECO2_SOLVER', 'highs')
+    highs = model_fingerprint(model)
+    assert highs == model_fingerprint(model, backend = 'highs')
+    monkeypatch.setenv('DECO2_SOLVER', 'cbc')
+    assert model_fingerprint(model) != highs
+    assert model_fingerprint(model, backend = 'highs') == highs
+
+
+def test_changing_the_solver_misses_the_cache(model, monkeypatch, tmp_path):
+    pytest.importorskip('highspy')
+    solves = []
+
+    #Whatever DECO2_SOLVER names, the solve itself runs on HiGHS, which is the backend available to the tests
+    def solve(model, **solve_options):
+        solves.append(os.environ['DECO2_SOLVER'])
+        return industry.solve(model, backend = 'highs', **solve_options)
+
+    monkeypatch.setenv('DECO2_SOLVER', 'highs')
+    assert not cached_solve(model, solve, cache_dir = str(tmp_path)).hit
+    assert cached_solve(model, solve, cache_dir = str(tmp_path)).hit
+    monkeypatch.setenv('DECO2_SOLVER', 'cbc')
+    assert not cached_solve(model, solve, cache_dir = str(tmp_path)).hit
+    assert solves == ['highs', 'cbc']